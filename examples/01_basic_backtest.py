@@ -7,6 +7,7 @@ crosses above a slow EMA, with fixed take-profit and stop-loss.
 from pathlib import Path
 
 from replaybt import BacktestEngine, CSVProvider, Strategy, Bar, MarketOrder, Side
+from replaybt.strategy.signals import crossover, crossunder
 
 DATA = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "sample_1m.csv"
 
@@ -15,16 +16,34 @@ class EMACrossover(Strategy):
     def configure(self, config):
         self._prev_fast = None
         self._prev_slow = None
+        self._ind, self._last = None, -1
+        self._up = self._down = None
+
+    def prepare(self, indicators):
+        # Batch mode (file-backed data): detect every cross up front
+        self._ind = indicators
+        self._last = -1
+        fast = indicators.batch_series("ema_fast")
+        slow = indicators.batch_series("ema_slow")
+        if fast is None or slow is None:
+            self._up = self._down = None
+            return
+        self._up = crossover(fast, slow)
+        self._down = crossunder(fast, slow)
 
     def on_bar(self, bar, indicators, positions):
         fast = indicators.get("ema_fast")
         slow = indicators.get("ema_slow")
-        if fast is None or slow is None or self._prev_fast is None:
-            self._prev_fast, self._prev_slow = fast, slow
-            return None
 
-        crossed_up = fast > slow and self._prev_fast <= self._prev_slow
-        crossed_down = fast < slow and self._prev_fast >= self._prev_slow
+        i = self._ind.cursor if self._ind is not None else -1
+        if self._up is not None and i == self._last + 1:
+            crossed_up, crossed_down = self._up[i], self._down[i]
+        elif fast is None or slow is None or self._prev_fast is None:
+            crossed_up = crossed_down = False
+        else:
+            crossed_up = fast > slow and self._prev_fast <= self._prev_slow
+            crossed_down = fast < slow and self._prev_fast >= self._prev_slow
+        self._last = i
         self._prev_fast, self._prev_slow = fast, slow
 
         if not positions:
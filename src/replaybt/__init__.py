@@ -20,71 +20,174 @@ Quick start:
     print(results.summary())
 """
 
-from .version import __version__
-
-# Core engine
-from .engine.loop import BacktestEngine
-from .engine.execution import ExecutionModel
-from .engine.portfolio import Portfolio
-from .engine.orders import Order, MarketOrder, LimitOrder, StopOrder, CancelPendingLimitsOrder
-from .engine.step import StepEngine, StepObservation, StepResult
-from .engine.processor import BarProcessor
-from .engine.multi import MultiAssetEngine
-
-# Data types
-from .data.types import Bar, Fill, Position, Trade, Side, OrderType, ExitReason, PendingOrder
+import importlib
+from typing import TYPE_CHECKING
 
-# Data providers
-from .data.providers.base import DataProvider
-from .data.providers.csv import CSVProvider
-from .data.providers.replay import ReplayProvider
-from .data.providers.live import AsyncDataProvider, HyperliquidProvider, LighterProvider
-from .data.cache import CachedProvider
-from .data.fetchers import BinanceProvider, BybitProvider
-
-# Data validation
-from .data.validation import DataValidator, DataIssue, validate_dataframe, validate_provider, ValidatedProvider
-
-# Indicators
-from .indicators.base import Indicator, IndicatorManager
-from .indicators.ema import EMA
-from .indicators.sma import SMA
-from .indicators.rsi import RSI
-from .indicators.atr import ATR
-from .indicators.chop import CHOP
-from .indicators.bollinger import BollingerBands
-from .indicators.macd import MACD
-from .indicators.stochastic import Stochastic
-from .indicators.vwap import VWAP
-from .indicators.obv import OBV
-from .indicators.resampler import Resampler
+from .version import __version__
 
-# Strategy
-from .strategy.base import Strategy
-from .strategy.config import StrategyConfig
-from .strategy.declarative import DeclarativeStrategy
+# Public names resolve on first access (PEP 562), so importing replaybt
+# only loads what a script actually uses -- e.g. no pandas, live
+# clients or fetchers for a plain BacktestEngine run.
+_LAZY = {
+    # Core engine
+    "BacktestEngine": ".engine.loop",
+    "ExecutionModel": ".engine.execution",
+    "Portfolio": ".engine.portfolio",
+    "Order": ".engine.orders",
+    "MarketOrder": ".engine.orders",
+    "LimitOrder": ".engine.orders",
+    "StopOrder": ".engine.orders",
+    "CancelPendingLimitsOrder": ".engine.orders",
+    "StepEngine": ".engine.step",
+    "StepObservation": ".engine.step",
+    "StepResult": ".engine.step",
+    "BarProcessor": ".engine.processor",
+    "MultiAssetEngine": ".engine.multi",
+    # Data types
+    "Bar": ".data.types",
+    "Fill": ".data.types",
+    "Position": ".data.types",
+    "Trade": ".data.types",
+    "Side": ".data.types",
+    "OrderType": ".data.types",
+    "ExitReason": ".data.types",
+    "PendingOrder": ".data.types",
+    # Data providers
+    "DataProvider": ".data.providers.base",
+    "CSVProvider": ".data.providers.csv",
+    "ReplayProvider": ".data.providers.replay",
+    "AsyncDataProvider": ".data.providers.live",
+    "HyperliquidProvider": ".data.providers.live",
+    "LighterProvider": ".data.providers.live",
+    "CachedProvider": ".data.cache",
+    "BinanceProvider": ".data.fetchers",
+    "BybitProvider": ".data.fetchers",
+    # Data validation
+    "DataValidator": ".data.validation",
+    "DataIssue": ".data.validation",
+    "validate_dataframe": ".data.validation",
+    "validate_provider": ".data.validation",
+    "ValidatedProvider": ".data.validation",
+    # Indicators
+    "Indicator": ".indicators.base",
+    "IndicatorManager": ".indicators.base",
+    "EMA": ".indicators.ema",
+    "SMA": ".indicators.sma",
+    "RSI": ".indicators.rsi",
+    "ATR": ".indicators.atr",
+    "CHOP": ".indicators.chop",
+    "BollingerBands": ".indicators.bollinger",
+    "MACD": ".indicators.macd",
+    "Stochastic": ".indicators.stochastic",
+    "VWAP": ".indicators.vwap",
+    "OBV": ".indicators.obv",
+    "Resampler": ".indicators.resampler",
+    # Strategy
+    "Strategy": ".strategy.base",
+    "StrategyConfig": ".strategy.config",
+    "DeclarativeStrategy": ".strategy.declarative",
+    # Reporting
+    "BacktestResults": ".reporting.metrics",
+    "MonthStats": ".reporting.monthly",
+    "monthly_breakdown": ".reporting.monthly",
+    "format_monthly_table": ".reporting.monthly",
+    "MultiAssetResults": ".reporting.multi",
+    # Validation
+    "BacktestAuditor": ".validation.auditor",
+    "Issue": ".validation.auditor",
+    "audit_file": ".validation.auditor",
+    "DelayTest": ".validation.stress",
+    "DelayTestResult": ".validation.stress",
+    "OOSSplit": ".validation.stress",
+    "OOSResult": ".validation.stress",
+    # Sizing
+    "PositionSizer": ".sizing",
+    "FixedSizer": ".sizing",
+    "EquityPctSizer": ".sizing",
+    "RiskPctSizer": ".sizing",
+    "KellySizer": ".sizing",
+    # Optimization
+    "ParameterSweep": ".optimize.sweep",
+    "SweepResults": ".optimize.results",
+    # Analysis
+    "MonteCarlo": ".analysis",
+    "MonteCarloResult": ".analysis",
+    "WalkForward": ".analysis",
+    "WalkForwardResult": ".analysis",
+    "WindowResult": ".analysis",
+    # Grid market making
+    "GridBacktestEngine": ".grid",
+    "GridConfig": ".grid",
+    "GridResults": ".grid",
+}
 
-# Reporting
-from .reporting.metrics import BacktestResults
-from .reporting.monthly import MonthStats, monthly_breakdown, format_monthly_table
-from .reporting.multi import MultiAssetResults
 
-# Validation
-from .validation.auditor import BacktestAuditor, Issue, audit_file
-from .validation.stress import DelayTest, DelayTestResult, OOSSplit, OOSResult
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Sizing
-from .sizing import PositionSizer, FixedSizer, EquityPctSizer, RiskPctSizer, KellySizer
 
-# Optimization
-from .optimize.sweep import ParameterSweep
-from .optimize.results import SweepResults
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Analysis
-from .analysis import MonteCarlo, MonteCarloResult, WalkForward, WalkForwardResult, WindowResult
 
-# Grid market making
-from .grid import GridBacktestEngine, GridConfig, GridResults
+if TYPE_CHECKING:
+    # Core engine
+    from .engine.loop import BacktestEngine
+    from .engine.execution import ExecutionModel
+    from .engine.portfolio import Portfolio
+    from .engine.orders import Order, MarketOrder, LimitOrder, StopOrder, CancelPendingLimitsOrder
+    from .engine.step import StepEngine, StepObservation, StepResult
+    from .engine.processor import BarProcessor
+    from .engine.multi import MultiAssetEngine
+    # Data types
+    from .data.types import Bar, Fill, Position, Trade, Side, OrderType, ExitReason, PendingOrder
+    # Data providers
+    from .data.providers.base import DataProvider
+    from .data.providers.csv import CSVProvider
+    from .data.providers.replay import ReplayProvider
+    from .data.providers.live import AsyncDataProvider, HyperliquidProvider, LighterProvider
+    from .data.cache import CachedProvider
+    from .data.fetchers import BinanceProvider, BybitProvider
+    # Data validation
+    from .data.validation import DataValidator, DataIssue, validate_dataframe, validate_provider, ValidatedProvider
+    # Indicators
+    from .indicators.base import Indicator, IndicatorManager
+    from .indicators.ema import EMA
+    from .indicators.sma import SMA
+    from .indicators.rsi import RSI
+    from .indicators.atr import ATR
+    from .indicators.chop import CHOP
+    from .indicators.bollinger import BollingerBands
+    from .indicators.macd import MACD
+    from .indicators.stochastic import Stochastic
+    from .indicators.vwap import VWAP
+    from .indicators.obv import OBV
+    from .indicators.resampler import Resampler
+    # Strategy
+    from .strategy.base import Strategy
+    from .strategy.config import StrategyConfig
+    from .strategy.declarative import DeclarativeStrategy
+    # Reporting
+    from .reporting.metrics import BacktestResults
+    from .reporting.monthly import MonthStats, monthly_breakdown, format_monthly_table
+    from .reporting.multi import MultiAssetResults
+    # Validation
+    from .validation.auditor import BacktestAuditor, Issue, audit_file
+    from .validation.stress import DelayTest, DelayTestResult, OOSSplit, OOSResult
+    # Sizing
+    from .sizing import PositionSizer, FixedSizer, EquityPctSizer, RiskPctSizer, KellySizer
+    # Optimization
+    from .optimize.sweep import ParameterSweep
+    from .optimize.results import SweepResults
+    # Analysis
+    from .analysis import MonteCarlo, MonteCarloResult, WalkForward, WalkForwardResult, WindowResult
+    # Grid market making
+    from .grid import GridBacktestEngine, GridConfig, GridResults
 
 __all__ = [
     # Engine
@@ -0,0 +1,34 @@
+"""Optional Numba JIT support.
+
+numba is an optional dependency. Install with::
+
+    pip install replaybt[fast]
+
+When numba is missing, ``njit`` is a no-op decorator and ``prange`` is
+``range``, so kernels written against this module still run (as plain
+Python) and produce the same results.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    prange = range
+
+
+__all__ = ["HAS_NUMBA", "njit", "prange"]
@@ -14,6 +14,7 @@ from typing import Dict, Optional
 
 import numpy as np
 
+from .._njit import HAS_NUMBA, njit, prange
 from ..reporting.metrics import BacktestResults
 
 
@@ -88,6 +89,14 @@ class MonteCarloResult:
 _PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
 _BATCH_SIZE = 1000
 
+# Upper bound on one bootstrap batch's equity matrix (float64 cells)
+_BOOTSTRAP_BATCH_BYTES = 64 * 1024 * 1024
+
+
+def _bootstrap_batch_size(n_trades: int) -> int:
+    """Simulations per bootstrap batch under ``_BOOTSTRAP_BATCH_BYTES``."""
+    return max(1, _BOOTSTRAP_BATCH_BYTES // (8 * (n_trades + 1)))
+
 
 def _max_dd_pct(equity_curves: np.ndarray) -> np.ndarray:
     """Compute max drawdown % for each row of equity curves.
@@ -106,6 +115,49 @@ def _max_dd_pct(equity_curves: np.ndarray) -> np.ndarray:
     return np.max(drawdowns, axis=1) * 100
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _shuffle_kernel(pnls, initial_equity, threshold, seeds):
+    """Fused shuffle simulation: one pass per path, no equity matrix.
+
+    Each path reseeds the thread-local generator from ``seeds[s]``,
+    Fisher-Yates shuffles a local index array, then streams equity,
+    running peak and max drawdown through scalars.
+
+    Returns:
+        (max_dds, ruined): max drawdown % per path (0-100 scale) and a
+        bool per path that is True if equity ever fell below threshold.
+    """
+    n_sims = len(seeds)
+    n_trades = len(pnls)
+    max_dds = np.empty(n_sims, dtype=np.float64)
+    ruined = np.zeros(n_sims, dtype=np.bool_)
+    for s in prange(n_sims):
+        np.random.seed(seeds[s])
+        idx = np.arange(n_trades)
+        for i in range(n_trades - 1, 0, -1):
+            j = np.random.randint(0, i + 1)
+            tmp = idx[i]
+            idx[i] = idx[j]
+            idx[j] = tmp
+
+        eq = initial_equity
+        peak = eq
+        max_dd = 0.0
+        hit = eq < threshold
+        for i in range(n_trades):
+            eq += pnls[idx[i]]
+            if eq > peak:
+                peak = eq
+            dd = (peak - eq) / peak if peak > 0 else peak - eq
+            if dd > max_dd:
+                max_dd = dd
+            if eq < threshold:
+                hit = True
+        max_dds[s] = max_dd * 100
+        ruined[s] = hit
+    return max_dds, ruined
+
+
 class MonteCarlo:
     """Monte Carlo simulation on backtest results.
 
@@ -170,7 +222,18 @@ class MonteCarlo:
         n_sims = self._n_simulations
 
         # --- Shuffle mode ---
-        shuffle_dds = self._run_shuffle(pnls, initial_equity, n_sims, rng)
+        if HAS_NUMBA:
+            # Max DD and ruin come from the same fused pass
+            seeds = rng.integers(0, 2**32, size=n_sims, dtype=np.uint32)
+            shuffle_dds, ruined = _shuffle_kernel(
+                pnls, float(initial_equity), float(self._ruin_threshold), seeds,
+            )
+            ruin_count = int(ruined.sum())
+        else:
+            shuffle_dds = self._run_shuffle(pnls, initial_equity, n_sims, rng)
+            ruin_count = self._count_ruin(
+                pnls, initial_equity, n_sims, rng, self._ruin_threshold
+            )
 
         # Shuffle final PnL is invariant (all paths sum to the same total)
         total_pnl = float(pnls.sum())
@@ -181,9 +244,6 @@ class MonteCarlo:
         }
 
         # Ruin probability from shuffle paths
-        ruin_count = self._count_ruin(
-            pnls, initial_equity, n_sims, rng, self._ruin_threshold
-        )
         ruin_prob = ruin_count / n_sims
 
         # --- Bootstrap mode ---
@@ -255,26 +315,34 @@ class MonteCarlo:
         n_sims: int,
         rng: np.random.Generator,
     ) -> tuple:
-        """Run bootstrap simulations in batches. Returns (final_pnls, max_dds)."""
-        n_trades = len(pnls)
-        all_final_pnls = []
-        all_dds = []
+        """Run bootstrap simulations in batches. Returns (final_pnls, max_dds).
 
-        for start in range(0, n_sims, _BATCH_SIZE):
-            batch = min(_BATCH_SIZE, n_sims - start)
-            indices = rng.integers(0, n_trades, size=(batch, n_trades))
-            sampled_pnls = pnls[indices]
+        Each batch draws an int32 index matrix in one call and builds its
+        equity curves with a single cumsum; batches are sized so the curve
+        matrix stays under ``_BOOTSTRAP_BATCH_BYTES``.
+        """
+        n_trades = len(pnls)
+        batch_size = _bootstrap_batch_size(n_trades)
+        final_pnls = np.empty(n_sims, dtype=np.float64)
+        max_dds = np.empty(n_sims, dtype=np.float64)
+
+        for start in range(0, n_sims, batch_size):
+            batch = min(batch_size, n_sims - start)
+            indices = rng.integers(
+                0, n_trades, size=(batch, n_trades), dtype=np.int32,
+            )
 
             # Build equity curves
             equity = np.empty((batch, n_trades + 1), dtype=np.float64)
             equity[:, 0] = initial_equity
-            np.cumsum(sampled_pnls, axis=1, out=equity[:, 1:])
+            np.cumsum(pnls[indices], axis=1, out=equity[:, 1:])
             equity[:, 1:] += initial_equity
 
-            all_final_pnls.append(sampled_pnls.sum(axis=1))
-            all_dds.append(_max_dd_pct(equity))
+            stop = start + batch
+            np.subtract(equity[:, -1], initial_equity, out=final_pnls[start:stop])
+            max_dds[start:stop] = _max_dd_pct(equity)
 
-        return np.concatenate(all_final_pnls), np.concatenate(all_dds)
+        return final_pnls, max_dds
 
     @staticmethod
     def _count_ruin(
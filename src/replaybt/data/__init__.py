@@ -1,5 +1,28 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from .types import Bar, Fill, Position, Trade, Side, OrderType
-from .validation import DataValidator, DataIssue, validate_dataframe, validate_provider
+
+# Validation pulls in pandas; resolve it on first access (PEP 562)
+_LAZY = {
+    "DataValidator": ".validation",
+    "DataIssue": ".validation",
+    "validate_dataframe": ".validation",
+    "validate_provider": ".validation",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    from .validation import DataValidator, DataIssue, validate_dataframe, validate_provider
 
 __all__ = [
     "Bar", "Fill", "Position", "Trade", "Side", "OrderType",
@@ -7,8 +7,9 @@ import re
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Optional, Union
+from typing import Dict, Iterator, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from .providers.base import DataProvider
@@ -205,6 +206,14 @@ class CachedProvider(DataProvider):
         if self._inner is not None:
             self._inner.reset()
 
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """Return contiguous OHLCV column arrays (see CSVProvider.as_arrays)."""
+        return self._get_inner().as_arrays()
+
+    def slice(self, start: int, stop: int) -> CSVProvider:
+        """Provider over rows ``[start, stop)`` (see CSVProvider.slice)."""
+        return self._get_inner().slice(start, stop)
+
     def to_dataframe(self) -> pd.DataFrame:
         """Return the underlying dataframe."""
         return self._get_inner().to_dataframe()
@@ -0,0 +1,89 @@
+"""Columnar (structure-of-arrays) record buffers for fills and trades.
+
+The engine keeps the public ``List[Trade]`` / ``List[Fill]`` on the
+Portfolio, and mirrors the numeric fields into growable NumPy structured
+arrays so reporting can reduce over contiguous columns instead of
+walking Python objects.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from .types import _LONG, SIDE_LONG, SIDE_SHORT, Side
+
+TRADE_DTYPE = np.dtype([
+    ("entry_ts", "i8"),
+    ("exit_ts", "i8"),
+    ("side", "i1"),
+    ("entry_price", "f8"),
+    ("exit_price", "f8"),
+    ("size_usd", "f8"),
+    ("pnl_usd", "f8"),
+    ("pnl_pct", "f8"),
+    ("fees", "f8"),
+    ("is_partial", "?"),
+])
+
+FILL_DTYPE = np.dtype([
+    ("ts", "i8"),
+    ("side", "i1"),
+    ("price", "f8"),
+    ("size_usd", "f8"),
+    ("fees", "f8"),
+    ("is_entry", "?"),
+])
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def to_epoch_ns(dt: datetime) -> int:
+    """Convert a datetime to integer epoch nanoseconds (naive = UTC)."""
+    epoch = _EPOCH_NAIVE if dt.tzinfo is None else _EPOCH_UTC
+    return (dt - epoch) // _ONE_US * 1000
+
+
+def side_tag(side: Side) -> int:
+    """Encode a Side as the int8 tag used in record columns."""
+    return SIDE_LONG if side == _LONG else SIDE_SHORT
+
+
+class RecordBuffer:
+    """Append-only structured array with amortized O(1) growth.
+
+    Args:
+        dtype: Structured NumPy dtype of one record.
+        capacity: Initial number of preallocated records.
+    """
+
+    def __init__(self, dtype: np.dtype, capacity: int = 64):
+        self._data = np.empty(max(capacity, 1), dtype=dtype)
+        self._n = 0
+
+    def append(self, record: tuple) -> None:
+        """Append one record (a tuple in dtype field order)."""
+        if self._n == len(self._data):
+            grown = np.empty(len(self._data) * 2, dtype=self._data.dtype)
+            grown[:self._n] = self._data
+            self._data = grown
+        self._data[self._n] = record
+        self._n += 1
+
+    @property
+    def records(self) -> np.ndarray:
+        """View of the filled records (no copy)."""
+        return self._data[:self._n]
+
+    def column(self, name: str) -> np.ndarray:
+        """View of a single field over the filled records."""
+        return self._data[name][:self._n]
+
+    def clear(self) -> None:
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
@@ -1,7 +1,32 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import DataProvider
-from .csv import CSVProvider
-from .replay import ReplayProvider
-from .live import AsyncDataProvider, HyperliquidProvider, LighterProvider
+
+# Providers resolve on first access (PEP 562): the CSV provider needs
+# pandas and the live ones their async clients.
+_LAZY = {
+    "CSVProvider": ".csv",
+    "ReplayProvider": ".replay",
+    "AsyncDataProvider": ".live",
+    "HyperliquidProvider": ".live",
+    "LighterProvider": ".live",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    from .csv import CSVProvider
+    from .replay import ReplayProvider
+    from .live import AsyncDataProvider, HyperliquidProvider, LighterProvider
 
 __all__ = [
     "DataProvider",
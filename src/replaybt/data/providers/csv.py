@@ -2,14 +2,116 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Dict, Iterator, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..types import Bar
 from .base import DataProvider
 
+_OHLCV = ("open", "high", "low", "close", "volume")
+
+# Parsed + sorted frames shared across provider instances, keyed by
+# (resolved path, mtime_ns, size, timestamp_col). Bounded LRU.
+_CACHE: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_SIZE = 8
+
+
+def _sidecar_path(path: Path, timestamp_col: str) -> Path:
+    """``<file>.<digest>.npy`` next to ``path``; the digest pins the source version."""
+    stat = path.stat()
+    key = f"{stat.st_mtime_ns}:{stat.st_size}:{timestamp_col}".encode()
+    digest = hashlib.sha1(key).hexdigest()[:16]
+    return path.with_name(f"{path.name}.{digest}.npy")
+
+
+def _write_sidecar(sidecar: Path, ts: np.ndarray, prices: Dict[str, np.ndarray]) -> None:
+    """Persist columns as one (6, n) int64 array: timestamps, then OHLCV bits.
+
+    Written to a temp file, fsynced and renamed into place, so readers
+    never see a partial sidecar.
+    """
+    block = np.empty((1 + len(_OHLCV), len(ts)), dtype=np.int64)
+    block[0] = ts
+    block[1:].view(np.float64)[:] = [prices[col] for col in _OHLCV]
+    fd, tmp = tempfile.mkstemp(dir=sidecar.parent, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, block)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, sidecar)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _read_sidecar(sidecar: Path) -> Dict[str, np.ndarray]:
+    """Memory-map a sidecar written by _write_sidecar() (read-only views)."""
+    block = np.load(sidecar, mmap_mode="r")
+    prices = block[1:].view(np.float64)
+    arrays = {"timestamp": block[0]}
+    for row, col in enumerate(_OHLCV):
+        arrays[col] = prices[row]
+    return arrays
+
+
+def clear_cache() -> None:
+    """Drop all parsed files held by the CSVProvider cache."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def _read_sorted(path: Path, timestamp_col: str) -> pd.DataFrame:
+    """Parse a CSV/Parquet file and sort by timestamp (memoized).
+
+    The returned frame is shared between providers and must not be
+    mutated in place.
+    """
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size, timestamp_col)
+    with _CACHE_LOCK:
+        df = _CACHE.get(key)
+        if df is not None:
+            _CACHE.move_to_end(key)
+            return df
+
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(
+            path,
+            engine="c",
+            dtype={col: "float64" for col in _OHLCV},
+        )
+
+    # Normalize timestamp
+    if timestamp_col in df.columns:
+        df["timestamp"] = pd.to_datetime(df[timestamp_col])
+    elif "date" in df.columns:
+        df["timestamp"] = pd.to_datetime(df["date"])
+    else:
+        # Assume first column is timestamp
+        df["timestamp"] = pd.to_datetime(df.iloc[:, 0])
+
+    df = df.sort_values("timestamp").reset_index(drop=True)
+
+    with _CACHE_LOCK:
+        _CACHE[key] = df
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return df
+
 
 class CSVProvider(DataProvider):
     """Load OHLCV data from CSV or Parquet files.
@@ -24,6 +126,11 @@ class CSVProvider(DataProvider):
         start: Optional start date filter (inclusive).
         end: Optional end date filter (inclusive).
         timestamp_col: Name of the timestamp column.
+        mmap_cache: Persist the parsed columns to a ``.npy`` sidecar next
+            to the file and memory-map it on later loads, so repeated runs
+            and worker processes skip parsing and share one page-cached
+            copy. Only used for tz-naive timestamps; the sidecar is keyed
+            on the file's mtime and size, so edits invalidate it.
     """
 
     def __init__(
@@ -34,6 +141,7 @@ class CSVProvider(DataProvider):
         start: Optional[str] = None,
         end: Optional[str] = None,
         timestamp_col: str = "timestamp",
+        mmap_cache: bool = False,
     ):
         self._path = Path(path)
         self._symbol = symbol_name or self._infer_symbol()
@@ -41,7 +149,11 @@ class CSVProvider(DataProvider):
         self._start = start
         self._end = end
         self._timestamp_col = timestamp_col
+        self._mmap_cache = mmap_cache
         self._df: Optional[pd.DataFrame] = None
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        # Row window set by slice(), relative to the date-filtered data
+        self._rows: Optional[range] = None
 
     def _infer_symbol(self) -> str:
         """Try to extract symbol from filename like 'ETH_1m.csv'."""
@@ -54,21 +166,7 @@ class CSVProvider(DataProvider):
         if self._df is not None:
             return self._df
 
-        if self._path.suffix == ".parquet":
-            df = pd.read_parquet(self._path)
-        else:
-            df = pd.read_csv(self._path)
-
-        # Normalize timestamp
-        if self._timestamp_col in df.columns:
-            df["timestamp"] = pd.to_datetime(df[self._timestamp_col])
-        elif "date" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["date"])
-        else:
-            # Assume first column is timestamp
-            df["timestamp"] = pd.to_datetime(df.iloc[:, 0])
-
-        df = df.sort_values("timestamp").reset_index(drop=True)
+        df = _read_sorted(self._path, self._timestamp_col)
 
         # Filter date range
         if self._start:
@@ -77,29 +175,108 @@ class CSVProvider(DataProvider):
             df = df[df["timestamp"] <= self._end]
 
         # Ensure required columns
-        for col in ("open", "high", "low", "close", "volume"):
+        for col in _OHLCV:
             if col not in df.columns:
                 raise ValueError(f"Missing required column: {col}")
 
+        if self._rows is not None:
+            df = df.iloc[self._rows.start:self._rows.stop]
+
         self._df = df
         return df
 
-    def __iter__(self) -> Iterator[Bar]:
+    def _sidecar_arrays(self) -> Optional[Dict[str, np.ndarray]]:
+        """Date-filtered column views from the mmap sidecar, creating it if needed.
+
+        Returns None when the data can't use a sidecar (tz-aware
+        timestamps, or a directory that isn't writable).
+        """
+        sidecar = _sidecar_path(self._path, self._timestamp_col)
+        if not sidecar.exists():
+            df = _read_sorted(self._path, self._timestamp_col)
+            if df["timestamp"].dt.tz is not None:
+                return None
+            for col in _OHLCV:
+                if col not in df.columns:
+                    raise ValueError(f"Missing required column: {col}")
+            ts = pd.DatetimeIndex(df["timestamp"]).as_unit("ns").asi8
+            prices = {col: df[col].to_numpy(dtype=np.float64) for col in _OHLCV}
+            try:
+                _write_sidecar(sidecar, ts, prices)
+            except OSError:
+                return None
+
+        arrays = _read_sidecar(sidecar)
+        ts = arrays["timestamp"]
+        lo, hi = 0, len(ts)
+        if self._start:
+            lo = int(np.searchsorted(ts, pd.Timestamp(self._start).as_unit("ns").value, "left"))
+        if self._end:
+            hi = int(np.searchsorted(ts, pd.Timestamp(self._end).as_unit("ns").value, "right"))
+        rows = range(lo, max(lo, hi))
+        if self._rows is not None:
+            rows = rows[self._rows.start:self._rows.stop]
+        return {key: col[rows.start:rows.stop] for key, col in arrays.items()}
+
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """Return contiguous column arrays for the filtered data.
+
+        Keys are 'timestamp' (int64 epoch nanoseconds) and 'open',
+        'high', 'low', 'close', 'volume' (float64). Built once and
+        cached; treat the arrays as read-only.
+        """
+        if self._arrays is not None:
+            return self._arrays
+
+        if self._mmap_cache and self._df is None:
+            arrays = self._sidecar_arrays()
+            if arrays is not None:
+                self._arrays = arrays
+                return arrays
+
         df = self._load()
+        ts = pd.DatetimeIndex(df["timestamp"]).as_unit("ns")
+        arrays = {"timestamp": ts.asi8}
+        for col in _OHLCV:
+            arrays[col] = np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+        self._arrays = arrays
+        return arrays
+
+    def slice(self, start: int, stop: int) -> "CSVProvider":
+        """Provider over rows ``[start, stop)`` of this one's data.
+
+        Shares the parsed frame and column arrays (no re-parse, no
+        copy), so train/test splits can each run in batch mode.
+        """
+        arrays = self.as_arrays()
+        view = copy.copy(self)
+        rows = range(len(arrays["timestamp"])) if self._rows is None else self._rows
+        view._rows = rows[start:stop]
+        view._df = None if self._df is None else self._df.iloc[start:stop]
+        view._arrays = {key: col[start:stop] for key, col in arrays.items()}
+        return view
+
+    def __iter__(self) -> Iterator[Bar]:
+        arrays = self.as_arrays()
         sym = self._symbol
         tf = self._timeframe
 
-        for row in df.itertuples(index=False):
-            yield Bar(
-                timestamp=row.timestamp.to_pydatetime(),
-                open=float(row.open),
-                high=float(row.high),
-                low=float(row.low),
-                close=float(row.close),
-                volume=float(row.volume),
-                symbol=sym,
-                timeframe=tf,
-            )
+        if self._df is None:
+            # Sidecar-backed: timestamps are tz-naive epoch ns
+            timestamps = pd.DatetimeIndex(
+                arrays["timestamp"].astype("datetime64[ns]")
+            ).to_pydatetime()
+        else:
+            timestamps = pd.DatetimeIndex(self._df["timestamp"]).to_pydatetime()
+        for ts, o, h, l, c, v in zip(
+            timestamps,
+            arrays["open"].tolist(),
+            arrays["high"].tolist(),
+            arrays["low"].tolist(),
+            arrays["close"].tolist(),
+            arrays["volume"].tolist(),
+        ):
+            yield Bar(ts, o, h, l, c, v, sym, tf)
 
     def symbol(self) -> str:
         return self._symbol
@@ -108,11 +285,13 @@ class CSVProvider(DataProvider):
         return self._timeframe
 
     def reset(self) -> None:
-        pass  # Stateless — re-iterates from cached df
+        pass  # Stateless — re-iterates from the cached arrays
 
     def to_dataframe(self) -> pd.DataFrame:
         """Return the underlying dataframe (useful for indicator pre-computation)."""
         return self._load().copy()
 
     def __len__(self) -> int:
+        if self._mmap_cache or self._arrays is not None:
+            return len(self.as_arrays()["timestamp"])
         return len(self._load())
@@ -8,10 +8,26 @@ from enum import Enum
 from typing import Optional
 
 
+# Integer side tags used by the engine's columnar buffers (int8 columns)
+SIDE_LONG = 1
+SIDE_SHORT = -1
+
+
 class Side(str, Enum):
     LONG = "LONG"
     SHORT = "SHORT"
 
+    @property
+    def tag(self) -> int:
+        """Integer tag for this side (SIDE_LONG / SIDE_SHORT)."""
+        return SIDE_LONG if self == _LONG else SIDE_SHORT
+
+
+# Enum member lookup goes through the metaclass on every access, so hot
+# paths compare against these module-level bindings instead.
+_LONG = Side.LONG
+_SHORT = Side.SHORT
+
 
 class OrderType(str, Enum):
     MARKET = "MARKET"
@@ -72,7 +88,7 @@ class Position:
 
     @property
     def is_long(self) -> bool:
-        return self.side == Side.LONG
+        return self.side == _LONG
 
 
 @dataclass(frozen=True, slots=True)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
-from ..data.types import Bar, Fill, Position, Side
+from ..data.types import _LONG, Bar, Fill, Position, Side
 
 
 @dataclass(slots=True)
@@ -32,7 +32,7 @@ class ExecutionModel:
         LONG: price goes UP (you pay more).
         SHORT: price goes DOWN (you receive less).
         """
-        if side == Side.LONG:
+        if side == _LONG:
             return price * (1 + self.slippage)
         else:
             return price * (1 - self.slippage)
@@ -43,7 +43,7 @@ class ExecutionModel:
         LONG exit: price goes DOWN (you receive less).
         SHORT exit: price goes UP (you pay more).
         """
-        if side == Side.LONG:
+        if side == _LONG:
             return price * (1 - self.slippage)
         else:
             return price * (1 + self.slippage)
@@ -166,7 +166,7 @@ class ExecutionModel:
         LONG limit: fills when low <= limit_price.
         SHORT limit: fills when high >= limit_price.
         """
-        if side == Side.LONG:
+        if side == _LONG:
             return bar.low <= limit_price
         else:
             return bar.high >= limit_price
@@ -183,7 +183,7 @@ class ExecutionModel:
         Returns:
             (filled, fill_price). fill_price is 0.0 if not filled.
         """
-        if side == Side.LONG:
+        if side == _LONG:
             if bar.open >= stop_price:
                 return True, bar.open  # gap through
             if bar.high >= stop_price:
@@ -199,6 +199,8 @@ class BacktestEngine:
         self.portfolio.reset()
         self.indicators.reset()
         self._processor.reset()
+        self._precompute_indicators()
+        self.strategy.prepare(self.indicators)
         self._bar_count = 0
         self._first_bar = None
         self._last_bar = None
@@ -216,6 +218,20 @@ class BacktestEngine:
             last_bar=self._last_bar,
         )
 
+    def _precompute_indicators(self) -> None:
+        """Compute 1m indicator series up front when the data is in memory.
+
+        Providers exposing ``as_arrays()`` (CSVProvider, CachedProvider)
+        know their full OHLCV history before the first bar, so each
+        indicator can be filled with a single (Numba-compiled when
+        available) pass instead of per-bar Python updates. Streaming
+        providers keep the incremental path.
+        """
+        as_arrays = getattr(self.data, "as_arrays", None)
+        if as_arrays is None:
+            return
+        self.indicators.precompute(as_arrays())
+
     def _process_bar(self, bar: Bar) -> None:
         """Process a single bar through the 4-phase loop."""
         self._bar_count += 1
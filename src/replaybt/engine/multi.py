@@ -8,7 +8,8 @@ Key features:
   - Per-symbol Portfolio, IndicatorManager, and BarProcessor
   - Shared ExecutionModel and Strategy
   - Time-synchronized bar processing via min-heap merge
-  - Optional portfolio-level exposure cap
+  - Optional portfolio-level exposure cap (per-symbol exposure vector)
+  - Batch indicator precompute for in-memory providers
   - Per-symbol config overrides
 """
 
@@ -17,6 +18,8 @@ from __future__ import annotations
 import heapq
 from typing import Callable, Dict, List, Optional
 
+import numpy as np
+
 from ..data.types import Bar
 from ..data.providers.base import DataProvider
 from ..indicators.base import IndicatorManager
@@ -83,6 +86,13 @@ class MultiAssetEngine:
             "max_total_exposure_usd"
         )
 
+        # Symbols in processing order; index into the exposure vector
+        self._symbols: List[str] = sorted(assets.keys())
+        self._sym_index: Dict[str, int] = {
+            sym: k for k, sym in enumerate(self._symbols)
+        }
+        self._exposure = np.zeros(len(self._symbols), dtype=np.float64)
+
         # Per-symbol overrides
         symbol_configs = self.config.get("symbol_configs", {})
 
@@ -99,7 +109,7 @@ class MultiAssetEngine:
             "signal": [],
         }
 
-        for sym in sorted(assets.keys()):
+        for sym in self._symbols:
             sym_cfg = self._resolve_config(sym, symbol_configs)
 
             portfolio = Portfolio(
@@ -166,14 +176,16 @@ class MultiAssetEngine:
             self._processors[sym].reset()
             self._first_bars[sym] = None
             self._last_bars[sym] = None
+        self._exposure[:] = 0.0
 
         # Build iterators and seed the min-heap
         # Heap entries: (timestamp, symbol_name, bar, iterator)
         heap: list = []
         iterators: Dict[str, iter] = {}
 
-        for sym in sorted(self.assets.keys()):
+        for sym in self._symbols:
             self.assets[sym].reset()
+            self._precompute_indicators(sym)
             it = iter(self.assets[sym])
             iterators[sym] = it
             try:
@@ -197,6 +209,10 @@ class MultiAssetEngine:
             # Process through the symbol's BarProcessor
             self._processors[sym].process_bar(bar)
 
+            # Only this symbol's positions can have changed
+            if self._max_total_exposure is not None:
+                self._update_exposure(sym)
+
             # Restore max_positions after processing
             self._restore_max_positions(sym)
 
@@ -214,16 +230,32 @@ class MultiAssetEngine:
             config=self.config,
         )
 
+    def _precompute_indicators(self, sym: str) -> None:
+        """Fill a symbol's indicator series up front when its data is in memory.
+
+        Same contract as BacktestEngine._precompute_indicators(): providers
+        exposing ``as_arrays()`` get one batch pass per indicator, others
+        keep the incremental path.
+        """
+        as_arrays = getattr(self.assets[sym], "as_arrays", None)
+        if as_arrays is None:
+            return
+        self._indicators[sym].precompute(as_arrays())
+
+    def _update_exposure(self, sym: str) -> None:
+        """Refresh one symbol's slot in the exposure vector."""
+        self._exposure[self._sym_index[sym]] = sum(
+            pos.size_usd for pos in self._portfolios[sym].positions
+        )
+
     def _enforce_exposure_cap(self, current_sym: str) -> None:
         """Temporarily limit position opens if exposure cap would be breached."""
         if self._max_total_exposure is None:
             return
 
-        # Calculate current total exposure (sum of all open position sizes)
-        total_exposure = 0.0
-        for sym, portfolio in self._portfolios.items():
-            for pos in portfolio.positions:
-                total_exposure += pos.size_usd
+        # Total exposure is one reduction over the per-symbol vector,
+        # kept current after every processed bar.
+        total_exposure = float(self._exposure.sum())
 
         # If we're already at/above cap, prevent this symbol from opening new
         if total_exposure >= self._max_total_exposure:
@@ -5,7 +5,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional, Tuple
 
-from ..data.types import Bar, Fill, Position, Trade, Side
+from ..data.columns import (
+    FILL_DTYPE, TRADE_DTYPE, RecordBuffer, side_tag, to_epoch_ns,
+)
+from ..data.types import _LONG, Bar, Fill, Position, Trade, Side
 from .execution import ExecutionModel
 from .orders import Order
 
@@ -42,6 +45,10 @@ class Portfolio:
         self.fills: List[Fill] = []
         self.total_fees = 0.0
 
+        # Columnar mirrors of trades/fills for vectorized reporting
+        self.trade_columns = RecordBuffer(TRADE_DTYPE)
+        self.fill_columns = RecordBuffer(FILL_DTYPE)
+
         # Equity curve: list of (timestamp, equity) after each trade close
         self.equity_curve: List[Tuple[datetime, float]] = []
 
@@ -108,7 +115,7 @@ class Portfolio:
         tp_pct = order.take_profit_pct or 0.0
         sl_pct = order.stop_loss_pct or 0.0
 
-        if order.side == Side.LONG:
+        if order.side == _LONG:
             tp = price * (1 + tp_pct) if tp_pct else 0.0
             sl = price * (1 - sl_pct) if sl_pct else 0.0
         else:
@@ -148,7 +155,7 @@ class Portfolio:
             fees=fees,
             is_entry=True,
         )
-        self.fills.append(fill)
+        self._record_fill(fill)
 
         return fill
 
@@ -213,7 +220,7 @@ class Portfolio:
             is_entry=True,
             reason="MERGE",
         )
-        self.fills.append(fill)
+        self._record_fill(fill)
         return fill
 
     def close_position(
@@ -286,7 +293,7 @@ class Portfolio:
             is_partial=is_partial,
             group=pos.group,
         )
-        self.trades.append(trade)
+        self._record_trade(trade)
 
         # Track equity curve
         self.equity_curve.append((bar.timestamp, self.equity))
@@ -301,7 +308,7 @@ class Portfolio:
             is_entry=False,
             reason=reason,
         )
-        self.fills.append(fill)
+        self._record_fill(fill)
 
         return trade
 
@@ -313,5 +320,23 @@ class Portfolio:
         self.positions.clear()
         self.trades.clear()
         self.fills.clear()
+        self.trade_columns.clear()
+        self.fill_columns.clear()
         self.total_fees = 0.0
         self.equity_curve.clear()
+
+    def _record_fill(self, fill: Fill) -> None:
+        self.fills.append(fill)
+        self.fill_columns.append((
+            to_epoch_ns(fill.timestamp), side_tag(fill.side), fill.price,
+            fill.size_usd, fill.fees, fill.is_entry,
+        ))
+
+    def _record_trade(self, trade: Trade) -> None:
+        self.trades.append(trade)
+        self.trade_columns.append((
+            to_epoch_ns(trade.entry_time), to_epoch_ns(trade.exit_time),
+            side_tag(trade.side), trade.entry_price, trade.exit_price,
+            trade.size_usd, trade.pnl_usd, trade.pnl_pct, trade.fees,
+            trade.is_partial,
+        ))
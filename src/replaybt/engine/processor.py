@@ -83,7 +83,7 @@ class BarProcessor:
         self._pending_stops: List[_PendingStop] = []
 
     def _emit(self, event: str, *args) -> None:
-        for cb in self._callbacks.get(event, []):
+        for cb in self._callbacks.get(event, ()):
             cb(*args)
 
     def _handle_follow_up(self, order) -> None:
@@ -329,7 +329,12 @@ class BarProcessor:
         # ============================================================
         # PHASE 3.5: Strategy-initiated exits (e.g. HTF RSI exit)
         # ============================================================
-        strat_exits = self.strategy.check_exits(bar, list(self.portfolio.positions))
+        # Skipped (with its positions copy) unless the strategy overrides it
+        strategy = self.strategy
+        if type(strategy).check_exits is Strategy.check_exits:
+            strat_exits = ()
+        else:
+            strat_exits = strategy.check_exits(bar, list(self.portfolio.positions))
         for exit_tuple in sorted(
             strat_exits, key=lambda x: x[0], reverse=True
         ):
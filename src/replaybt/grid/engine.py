@@ -6,6 +6,11 @@ replaybt's DataProvider and return GridResults.
 
 from __future__ import annotations
 
+from collections import deque
+
+import numpy as np
+
+from .._njit import njit
 from ..data.providers.base import DataProvider
 from .inventory import InventoryTracker
 from .manager import GridManager
@@ -15,11 +20,37 @@ from .types import (
     GridFill,
     GridResults,
     OrderSide,
-    OrderStatus,
     _compute_sharpe,
 )
 
 
+@njit(cache=True)
+def _vol_guard_atr_pct(high, low, close, period):
+    """True range per bar, and ATR as % of close over each contiguous
+    ``period``-bar TR window.
+
+    ``tr[i]`` uses bar ``i`` and the previous close, so the first full
+    window ends at bar ``period``; earlier entries are NaN. Windows are
+    summed oldest-first to match the engine's list-based fallback.
+    """
+    n = len(close)
+    tr = np.zeros(n)
+    for i in range(1, n):
+        tr[i] = max(
+            high[i] - low[i],
+            abs(high[i] - close[i - 1]),
+            abs(low[i] - close[i - 1]),
+        )
+    out = np.full(n, np.nan)
+    for i in range(period, n):
+        total = 0.0
+        for j in range(i - period + 1, i + 1):
+            total += tr[j]
+        atr = total / period
+        out[i] = (atr / close[i]) * 100 if close[i] > 0 else 0.0
+    return tr, out
+
+
 class GridBacktestEngine:
     """Run a grid market making backtest through DataProvider bars."""
 
@@ -87,10 +118,22 @@ class GridBacktestEngine:
         last_recenter_bar = 0
         is_paused = False
 
-        # Vol guard state
+        # Vol guard state. ATR over contiguous bars comes from one
+        # compiled pass; the TR window is only summed directly when the
+        # circuit breaker skipped bars inside it.
         vol_guard_paused = False
         vol_guard_cooldown_remaining = 0
-        true_ranges: list[float] = []
+        atr_period = config.vol_guard_atr_period
+        true_ranges: deque[float] = deque(maxlen=atr_period)
+        last_skipped = 0  # bar 0 never feeds the TR window
+        if config.vol_guard_enabled:
+            tr_arr, atr_pct_arr = _vol_guard_atr_pct(
+                np.array([b.high for b in bars], dtype=np.float64),
+                np.array([b.low for b in bars], dtype=np.float64),
+                np.array([b.close for b in bars], dtype=np.float64),
+                atr_period,
+            )
+            tr_arr, atr_pct_arr = tr_arr.tolist(), atr_pct_arr.tolist()
 
         # Inventory reduce mode
         inv_reduce_active = False
@@ -98,7 +141,6 @@ class GridBacktestEngine:
         # Main loop
         for i in range(1, len(bars)):
             bar = bars[i]
-            prev_bar = bars[i - 1]
             mid_price = bar.close
 
             # --- Circuit breaker ---
@@ -117,6 +159,7 @@ class GridBacktestEngine:
                     grid_mgr.place_grid(grid_levels, bar_index=i)
                     last_recenter_bar = i
                 else:
+                    last_skipped = i
                     inv.update_peak_equity(mid_price)
                     dd = inv.get_drawdown(mid_price)
                     if dd > result.max_drawdown_pct:
@@ -129,18 +172,14 @@ class GridBacktestEngine:
 
             # --- Volatility guard ---
             if config.vol_guard_enabled:
-                tr = max(
-                    bar.high - bar.low,
-                    abs(bar.high - prev_bar.close),
-                    abs(bar.low - prev_bar.close),
-                )
-                true_ranges.append(tr)
-                if len(true_ranges) > config.vol_guard_atr_period:
-                    true_ranges.pop(0)
-
-                if len(true_ranges) == config.vol_guard_atr_period:
-                    atr = sum(true_ranges) / len(true_ranges)
-                    atr_pct = (atr / mid_price) * 100 if mid_price > 0 else 0
+                true_ranges.append(tr_arr[i])
+
+                if len(true_ranges) == atr_period:
+                    if i - atr_period >= last_skipped:
+                        atr_pct = atr_pct_arr[i]
+                    else:
+                        atr = sum(true_ranges) / atr_period
+                        atr_pct = (atr / mid_price) * 100 if mid_price > 0 else 0
 
                     if atr_pct >= config.vol_guard_threshold_pct:
                         if not vol_guard_paused:
@@ -209,14 +248,12 @@ class GridBacktestEngine:
             if not inv.can_buy():
                 for order in grid_mgr.get_open_orders(OrderSide.BID):
                     if not order.is_pingpong:
-                        grid_mgr.orders[order.id].status = OrderStatus.CANCELLED
-                        grid_mgr._open_ids.discard(order.id)
+                        grid_mgr.cancel_order(order.id)
 
             if not inv.can_sell():
                 for order in grid_mgr.get_open_orders(OrderSide.ASK):
                     if not order.is_pingpong:
-                        grid_mgr.orders[order.id].status = OrderStatus.CANCELLED
-                        grid_mgr._open_ids.discard(order.id)
+                        grid_mgr.cancel_order(order.id)
 
             # --- Inventory reduce mode ---
             if config.inventory_reduce_pct > 0:
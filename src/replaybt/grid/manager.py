@@ -8,9 +8,30 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
+
+from .._njit import njit
 from .types import GridFill, GridOrder, OrderSide, OrderStatus
 
 
+@njit(cache=True)
+def _match_bar(prices, is_bid, low, high):
+    """Positions of open orders touched by a candle's [low, high] range.
+
+    Bids fill when ``low <= price``, asks when ``high >= price``. The
+    returned positions keep the input order.
+    """
+    n = len(prices)
+    hits = np.empty(n, dtype=np.int64)
+    k = 0
+    for j in range(n):
+        p = prices[j]
+        if (is_bid[j] and low <= p) or (not is_bid[j] and high >= p):
+            hits[k] = j
+            k += 1
+    return hits[:k]
+
+
 class GridLevel:
     """A single level from the shape engine (price + size + side)."""
 
@@ -26,6 +47,10 @@ class GridManager:
     """Manages the virtual grid of bid/ask orders with ping-pong logic.
 
     Critical optimization: ``_open_ids`` set for O(1) open-order checks.
+    Fill matching runs against a cached array snapshot of the open book
+    (rebuilt only after the book changes): bars that reach neither the
+    best bid nor the best ask return without touching any order, and
+    the rest are matched by a compiled kernel.
     """
 
     def __init__(
@@ -41,6 +66,8 @@ class GridManager:
         self._open_ids: set[int] = set()
         self.fills: list[GridFill] = []
         self._next_id = 0
+        # (ids, prices, is_bid, best_bid, best_ask); None when stale
+        self._book: tuple | None = None
 
     def place_grid(self, grid_levels: list[GridLevel], bar_index: int = 0) -> None:
         """Place a full grid of orders (initial placement or after re-center)."""
@@ -55,6 +82,13 @@ class GridManager:
         for oid in list(self._open_ids):
             self.orders[oid].status = OrderStatus.CANCELLED
         self._open_ids.clear()
+        self._book = None
+
+    def cancel_order(self, order_id: int) -> None:
+        """Cancel a single open order."""
+        self.orders[order_id].status = OrderStatus.CANCELLED
+        self._open_ids.discard(order_id)
+        self._book = None
 
     def cancel_side(self, side: OrderSide) -> None:
         """Cancel all open orders on one side."""
@@ -62,6 +96,7 @@ class GridManager:
         for oid in to_cancel:
             self.orders[oid].status = OrderStatus.CANCELLED
             self._open_ids.discard(oid)
+        self._book = None
 
     def cancel_non_pingpong(self) -> None:
         """Cancel grid orders but keep ping-pongs (used for re-center)."""
@@ -69,6 +104,7 @@ class GridManager:
         for oid in to_cancel:
             self.orders[oid].status = OrderStatus.CANCELLED
             self._open_ids.discard(oid)
+        self._book = None
 
     def get_open_orders(self, side: OrderSide | None = None) -> list[GridOrder]:
         """Get all open orders, optionally filtered by side."""
@@ -94,50 +130,57 @@ class GridManager:
         Gap protection: if open gaps past an order, fill at open (worse price).
         """
         ts = timestamp or datetime(2000, 1, 1)
-        new_fills: list[GridFill] = []
-        filled_ids: list[int] = []
+        ids, prices, is_bid, best_bid, best_ask = self._open_book()
+        if candle_low > best_bid and candle_high < best_ask:
+            return []
 
-        for oid in list(self._open_ids):
-            order = self.orders[oid]
-            filled = False
+        new_fills: list[GridFill] = []
+        for j in _match_bar(prices, is_bid, candle_low, candle_high):
+            order = self.orders[ids[j]]
             fill_price = order.price
 
             if order.side == OrderSide.BID:
-                if candle_low <= order.price:
-                    filled = True
-                    if candle_open < order.price:
-                        fill_price = candle_open
-                    fill_price -= fill_price * self.slippage_pct
-            elif order.side == OrderSide.ASK:
-                if candle_high >= order.price:
-                    filled = True
-                    if candle_open > order.price:
-                        fill_price = candle_open
-                    fill_price -= fill_price * self.slippage_pct
-
-            if filled:
-                order.status = OrderStatus.FILLED
-                filled_ids.append(oid)
-                half_spread = order.price * self.spread_pct
-                fee = fill_price * order.size * self.maker_fee_pct
-
-                grid_fill = GridFill(
-                    order_id=order.id,
-                    price=fill_price,
-                    size=order.size,
-                    side=order.side,
-                    bar_index=bar_index,
-                    timestamp=ts,
-                    spread_earned=half_spread * order.size - fee,
-                )
-                self.fills.append(grid_fill)
-                new_fills.append(grid_fill)
-
-        for oid in filled_ids:
-            self._open_ids.discard(oid)
+                if candle_open < order.price:
+                    fill_price = candle_open
+            elif candle_open > order.price:
+                fill_price = candle_open
+            fill_price -= fill_price * self.slippage_pct
+
+            order.status = OrderStatus.FILLED
+            self._open_ids.discard(order.id)
+            half_spread = order.price * self.spread_pct
+            fee = fill_price * order.size * self.maker_fee_pct
+
+            grid_fill = GridFill(
+                order_id=order.id,
+                price=fill_price,
+                size=order.size,
+                side=order.side,
+                bar_index=bar_index,
+                timestamp=ts,
+                spread_earned=half_spread * order.size - fee,
+            )
+            self.fills.append(grid_fill)
+            new_fills.append(grid_fill)
 
+        if new_fills:
+            self._book = None
         return new_fills
 
+    def _open_book(self) -> tuple:
+        """Array snapshot of the open orders, in ``_open_ids`` iteration order."""
+        if self._book is None:
+            ids = list(self._open_ids)
+            orders = [self.orders[oid] for oid in ids]
+            prices = np.array([o.price for o in orders], dtype=np.float64)
+            is_bid = np.array(
+                [o.side == OrderSide.BID for o in orders], dtype=np.bool_,
+            )
+            best_bid = prices[is_bid].max() if is_bid.any() else -np.inf
+            best_ask = prices[~is_bid].min() if not is_bid.all() else np.inf
+            self._book = (ids, prices, is_bid, best_bid, best_ask)
+        return self._book
+
     def place_pingpong(
         self, fill: GridFill, mid_price: float, bar_index: int
     ) -> GridOrder | None:
@@ -198,4 +241,5 @@ class GridManager:
         self.orders[order.id] = order
         self._open_ids.add(order.id)
         self._next_id += 1
+        self._book = None
         return order
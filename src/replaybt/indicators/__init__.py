@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import Indicator, IndicatorManager
 from .ema import EMA
 from .sma import SMA
@@ -9,7 +12,22 @@ from .macd import MACD
 from .stochastic import Stochastic
 from .vwap import VWAP
 from .obv import OBV
-from .resampler import Resampler
+
+# Resampler needs pandas; resolve it on first access (PEP 562)
+_LAZY = {"Resampler": ".resampler"}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    from .resampler import Resampler
 
 __all__ = [
     "Indicator",
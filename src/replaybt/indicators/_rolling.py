@@ -0,0 +1,52 @@
+"""Vectorized rolling-window reductions for indicator precomputation.
+
+Each helper returns a float64 array the length of ``src`` with NaN for
+the first ``period - 1`` elements (the warmup). Windows are reduced with
+NumPy ufuncs over ``sliding_window_view`` in fixed-size blocks, so memory
+stays bounded regardless of series length.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Windows reduced per block (bounds the temporaries np.std allocates)
+_BLOCK = 1 << 16
+
+
+def _rolling(src: np.ndarray, period: int, reduce) -> np.ndarray:
+    n = len(src)
+    out = np.full(n, np.nan)
+    if period <= 0 or n < period:
+        return out
+    windows = sliding_window_view(src, period)
+    for start in range(0, len(windows), _BLOCK):
+        block = windows[start:start + _BLOCK]
+        out[start + period - 1:start + period - 1 + len(block)] = reduce(block)
+    return out
+
+
+def rolling_mean(src: np.ndarray, period: int) -> np.ndarray:
+    return _rolling(src, period, lambda w: w.mean(axis=1))
+
+
+def rolling_std(src: np.ndarray, period: int) -> np.ndarray:
+    """Population standard deviation (ddof=0) over each window."""
+    return _rolling(src, period, lambda w: w.std(axis=1))
+
+
+def rolling_max(src: np.ndarray, period: int) -> np.ndarray:
+    return _rolling(src, period, lambda w: w.max(axis=1))
+
+
+def rolling_min(src: np.ndarray, period: int) -> np.ndarray:
+    return _rolling(src, period, lambda w: w.min(axis=1))
+
+
+def ffill(values: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs (leading NaNs stay NaN)."""
+    valid = ~np.isnan(values)
+    idx = np.where(valid, np.arange(len(values)), 0)
+    np.maximum.accumulate(idx, out=idx)
+    return values[idx]
@@ -5,10 +5,46 @@ from __future__ import annotations
 from collections import deque
 from typing import Any, Dict, Optional
 
+import numpy as np
+
+from .._njit import njit
 from ..data.types import Bar
 from .base import Indicator
 
 
+@njit(cache=True)
+def _atr_loop(high, low, close, period, wilder, out):
+    """Fill ``out`` with ATR (rolling mean or Wilder-smoothed TR, NaN until warm)."""
+    n = close.shape[0]
+    if n == 0:
+        return
+    tr = np.empty(n)
+    tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        prev_close = close[i - 1]
+        tr[i] = max(
+            high[i] - low[i],
+            abs(high[i] - prev_close),
+            abs(low[i] - prev_close),
+        )
+
+    value = np.nan
+    seeded = False
+    total = 0.0
+    for i in range(n):
+        if wilder and seeded:
+            value = ((period - 1) * value + tr[i]) / period
+        else:
+            # Running window sum, same order as ATR._update_sma()
+            if i >= period:
+                total -= tr[i - period]
+            total += tr[i]
+            if i >= period - 1:
+                value = total / period
+                seeded = True
+        out[i] = value
+
+
 class ATR(Indicator):
     """Average True Range.
 
@@ -27,6 +63,7 @@ class ATR(Indicator):
         self.mode = mode
         self._prev_close: Optional[float] = None
         self._tr_window: deque = deque(maxlen=period)
+        self._tr_sum: float = 0.0
         self._value: Optional[float] = None
         # For wilder mode
         self._wilder_atr: Optional[float] = None
@@ -61,31 +98,47 @@ class ATR(Indicator):
             self._update_sma(tr)
 
     def _update_sma(self, tr: float) -> None:
-        """Simple rolling mean of TR."""
-        self._tr_window.append(tr)
+        """Simple rolling mean of TR (O(1) running window sum)."""
+        self._push_tr(tr)
         if len(self._tr_window) >= self.period:
-            self._value = sum(self._tr_window) / self.period
+            self._value = self._tr_sum / self.period
             self._ready = True
 
     def _update_wilder(self, tr: float) -> None:
         """Wilder's smoothed ATR: ATR = ((period-1)*prev_ATR + TR) / period."""
         if self._wilder_atr is None:
-            self._tr_window.append(tr)
+            self._push_tr(tr)
             if len(self._tr_window) >= self.period:
-                self._wilder_atr = sum(self._tr_window) / self.period
+                self._wilder_atr = self._tr_sum / self.period
                 self._value = self._wilder_atr
                 self._ready = True
         else:
             self._wilder_atr = ((self.period - 1) * self._wilder_atr + tr) / self.period
             self._value = self._wilder_atr
 
+    def _push_tr(self, tr: float) -> None:
+        if len(self._tr_window) == self.period:
+            self._tr_sum -= self._tr_window[0]
+        self._tr_window.append(tr)
+        self._tr_sum += tr
+
     def value(self) -> Optional[float]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        close = arrays["close"]
+        out = np.empty(len(close), dtype=np.float64)
+        _atr_loop(
+            arrays["high"], arrays["low"], close,
+            self.period, self.mode == "wilder", out,
+        )
+        return out
+
     def reset(self) -> None:
         super().reset()
         self._prev_close = None
         self._tr_window.clear()
+        self._tr_sum = 0.0
         self._value = None
         self._wilder_atr = None
         self._count = 0
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
 
 from ..data.types import Bar
 
@@ -40,6 +42,27 @@ class Indicator(ABC):
         """Reset internal state. Override in subclass."""
         self._ready = False
 
+    def precompute(
+        self, arrays: Dict[str, np.ndarray],
+    ) -> Optional[Union[np.ndarray, Dict[str, np.ndarray]]]:
+        """Compute the full value series in one pass (batch mode).
+
+        Override in subclass to let IndicatorManager serve values by
+        index instead of calling update() per bar. The result must match
+        what value() would return after each bar.
+
+        Args:
+            arrays: float64 column arrays keyed by 'open', 'high', 'low',
+                'close', 'volume', one element per bar. May also carry
+                'timestamp' as int64 epoch nanoseconds.
+
+        Returns:
+            float64 array aligned with the bars (NaN where value() would
+            be None), a dict of such arrays for dict-valued indicators,
+            or None if batch mode is not supported.
+        """
+        return None
+
     @staticmethod
     def batch_ema(series, period: int):
         """Compute EMA on a pandas Series (batch mode)."""
@@ -96,6 +119,23 @@ class IndicatorManager:
         self._resamplers: Dict[str, "_BarAccumulator"] = {}
         self._tf_indicators: Dict[str, List[str]] = defaultdict(list)
 
+        # Batch mode: precomputed 1m series served by bar index
+        self._precomputed: Dict[str, Union[np.ndarray, Dict[str, np.ndarray]]] = {}
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._live_1m: List[str] = []
+        self._cursor = -1
+
+        # Slot tables compiled once from the config: indicator names map to
+        # integer slots, and per-bar work walks flat lists instead of
+        # looking names up. _served[slot] holds the precomputed series as
+        # plain Python lists (None for warmup) -- or (keys, column lists)
+        # for dict-valued indicators -- and is None for live indicators.
+        self._slots: Dict[str, int] = {}
+        self._slot_names: List[str] = []
+        self._slot_indicators: List[Indicator] = []
+        self._served: List[Any] = []
+        self._live_updates: List[Any] = []
+
         self._build()
 
     def _register_builtins(self) -> None:
@@ -154,11 +194,93 @@ class IndicatorManager:
             if tf != "1m" and tf not in self._resamplers:
                 self._resamplers[tf] = _BarAccumulator(tf)
 
+        self._live_1m = list(self._tf_indicators.get("1m", []))
+        self._slot_names = list(self._indicators)
+        self._slot_indicators = list(self._indicators.values())
+        self._slots = {name: k for k, name in enumerate(self._slot_names)}
+        self._served = [None] * len(self._slot_names)
+        self._compile_live()
+
+    def _compile_live(self) -> None:
+        self._live_updates = [self._indicators[name].update for name in self._live_1m]
+
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> None:
+        """Precompute 1m indicator series from OHLCV column arrays.
+
+        Indicators that support batch mode are computed once here and
+        then served by index: the N-th update() call advances to bar N.
+        Indicators without batch support (and all higher-TF indicators)
+        keep updating incrementally. Call after reset(), before the
+        first update().
+
+        Args:
+            arrays: float64 column arrays keyed by 'open', 'high', 'low',
+                'close', 'volume', aligned with the bars to be processed.
+        """
+        self._precomputed = {}
+        self._served = [None] * len(self._slot_names)
+        self._arrays = arrays
+        for name in self._tf_indicators.get("1m", []):
+            series = self._indicators[name].precompute(arrays)
+            if series is not None:
+                self._precomputed[name] = series
+                self._served[self._slots[name]] = _served_form(series)
+        self._live_1m = [
+            name for name in self._tf_indicators.get("1m", [])
+            if name not in self._precomputed
+        ]
+        self._compile_live()
+        self._cursor = -1
+
+    @property
+    def cursor(self) -> int:
+        """Index of the last bar passed to update() (-1 before the first)."""
+        return self._cursor
+
+    @property
+    def batch_arrays(self) -> Optional[Dict[str, np.ndarray]]:
+        """OHLCV arrays given to precompute(), or None outside batch mode."""
+        return self._arrays
+
+    def batch_series(self, name: str) -> Optional[np.ndarray]:
+        """Full precomputed series for a scalar-valued 1m indicator.
+
+        Returns None if the indicator is not precomputed (higher TF,
+        no batch support, dict-valued, or not in batch mode).
+        """
+        series = self._precomputed.get(name)
+        return series if isinstance(series, np.ndarray) else None
+
+    def slot_of(self, name: str) -> Optional[int]:
+        """Integer slot of an indicator for value_at(), or None if unknown.
+
+        Resolve slots once (e.g. in Strategy.prepare()) to skip the name
+        lookup on every bar.
+        """
+        return self._slots.get(name)
+
+    def value_at(self, slot: int) -> Any:
+        """Current value of the indicator in ``slot`` (see slot_of())."""
+        served = self._served[slot]
+        if served is None:
+            return self._slot_indicators[slot].value()
+        i = self._cursor
+        if i < 0:
+            return None
+        if type(served) is list:
+            return served[i]
+        keys, cols = served
+        if cols[0][i] != cols[0][i]:
+            return None
+        return {key: col[i] for key, col in zip(keys, cols)}
+
     def update(self, bar: Bar) -> None:
         """Process a 1m bar. Resamples and updates indicators."""
+        self._cursor += 1
+
         # Update 1m indicators directly
-        for name in self._tf_indicators.get("1m", []):
-            self._indicators[name].update(bar)
+        for update in self._live_updates:
+            update(bar)
 
         # Accumulate into higher TFs
         for tf, accumulator in self._resamplers.items():
@@ -169,20 +291,60 @@ class IndicatorManager:
 
     def values(self) -> Dict[str, Any]:
         """Return current values of all indicators."""
+        if self._precomputed:
+            i = self._cursor
+            if i < 0:
+                return {
+                    name: None if served is not None else ind.value()
+                    for name, ind, served in zip(
+                        self._slot_names, self._slot_indicators, self._served,
+                    )
+                }
+            out: Dict[str, Any] = {}
+            for name, ind, served in zip(
+                self._slot_names, self._slot_indicators, self._served,
+            ):
+                if served is None:
+                    out[name] = ind.value()
+                elif type(served) is list:
+                    out[name] = served[i]
+                else:
+                    keys, cols = served
+                    out[name] = None if cols[0][i] != cols[0][i] else {
+                        key: col[i] for key, col in zip(keys, cols)
+                    }
+            return out
         return {
             name: ind.value() for name, ind in self._indicators.items()
         }
 
     def get(self, name: str) -> Any:
         """Get a single indicator's value."""
-        ind = self._indicators.get(name)
-        return ind.value() if ind else None
+        slot = self._slots.get(name)
+        if slot is None:
+            return None
+        return self.value_at(slot)
 
     def reset(self) -> None:
         for ind in self._indicators.values():
             ind.reset()
         for acc in self._resamplers.values():
             acc.reset()
+        # Drop batch series — precompute() must be called again
+        self._precomputed = {}
+        self._served = [None] * len(self._slot_names)
+        self._arrays = None
+        self._live_1m = list(self._tf_indicators.get("1m", []))
+        self._compile_live()
+        self._cursor = -1
+
+
+def _served_form(series: Union[np.ndarray, Dict[str, np.ndarray]]) -> Any:
+    """Convert a precomputed series to the form value_at() indexes."""
+    if isinstance(series, dict):
+        keys = list(series)
+        return keys, [series[k].tolist() for k in keys]
+    return [None if v != v else v for v in series.tolist()]
 
 
 class _BarAccumulator:
@@ -6,7 +6,10 @@ from collections import deque
 from math import sqrt
 from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
+
 from ..data.types import Bar
+from ._rolling import rolling_mean, rolling_std
 from .base import Indicator
 
 
@@ -32,6 +35,9 @@ class BollingerBands(Indicator):
         self.num_std = num_std
         self.source = source
         self._window: deque = deque(maxlen=period)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_sync = 0
         self._value: Optional[Dict[str, float]] = None
 
     @classmethod
@@ -45,14 +51,34 @@ class BollingerBands(Indicator):
 
     def update(self, bar: Bar) -> None:
         price = getattr(bar, self.source, bar.close)
-        self._window.append(price)
+        n = self.period
 
-        if len(self._window) < self.period:
+        # Welford's online mean/M2, sliding once the window is full
+        if len(self._window) == n:
+            old = self._window[0]
+            self._window.append(price)
+            old_mean = self._mean
+            self._mean += (price - old) / n
+            self._m2 += (price - old) * (price - self._mean + old - old_mean)
+        else:
+            self._window.append(price)
+            delta = price - self._mean
+            self._mean += delta / len(self._window)
+            self._m2 += delta * (price - self._mean)
+        self._since_sync += 1
+
+        if len(self._window) < n:
             return
 
-        n = self.period
-        mean = sum(self._window) / n
-        variance = sum((x - mean) ** 2 for x in self._window) / n
+        if self._since_sync >= n:
+            # Exact two-pass refresh once per window bounds rounding drift
+            # (amortized O(1) per bar)
+            self._mean = sum(self._window) / n
+            self._m2 = sum((x - self._mean) ** 2 for x in self._window)
+            self._since_sync = 0
+
+        mean = self._mean
+        variance = max(self._m2, 0.0) / n
         std = sqrt(variance)
 
         upper = mean + self.num_std * std
@@ -72,6 +98,29 @@ class BollingerBands(Indicator):
     def value(self) -> Optional[Dict[str, float]]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        price = arrays.get(self.source, arrays["close"])
+        mean = rolling_mean(price, self.period)
+        std = rolling_std(price, self.period)
+
+        upper = mean + self.num_std * std
+        lower = mean - self.num_std * std
+        width = upper - lower
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bandwidth = np.where(mean > 0, width / mean * 100, 0.0)
+            pct_b = np.where(upper != lower, (price - lower) / width, 0.5)
+        warm = np.isnan(mean)
+        bandwidth[warm] = np.nan
+        pct_b[warm] = np.nan
+
+        return {
+            "upper": upper,
+            "middle": mean,
+            "lower": lower,
+            "bandwidth": bandwidth,
+            "pct_b": pct_b,
+        }
+
     @property
     def upper(self) -> Optional[float]:
         return self._value["upper"] if self._value else None
@@ -87,4 +136,7 @@ class BollingerBands(Indicator):
     def reset(self) -> None:
         super().reset()
         self._window.clear()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_sync = 0
         self._value = None
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+import numpy as np
+
 from ..data.types import Bar
+from ._rolling import ffill
 from .base import Indicator
 from .atr import ATR
 
@@ -47,6 +50,14 @@ class CHOP(Indicator):
     def value(self) -> Optional[float]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        close = arrays["close"]
+        atr = self._atr.precompute(arrays)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chop = np.where(close > 0, atr / close * 100, np.nan)
+        # Non-positive closes keep the last value
+        return ffill(chop)
+
     @property
     def atr_value(self) -> Optional[float]:
         """Access the underlying ATR value."""
@@ -4,10 +4,30 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+import numpy as np
+
+from .._njit import njit
 from ..data.types import Bar
 from .base import Indicator
 
 
+@njit(cache=True)
+def _ema_loop(src, alpha, out):
+    """Fill ``out`` with the EMA of ``src`` (seeded with the first value).
+
+    Uses the same update order as EMA.update() so batch and
+    incremental values are bit-identical.
+    """
+    n = src.shape[0]
+    if n == 0:
+        return
+    val = src[0]
+    out[0] = val
+    for i in range(1, n):
+        val = (src[i] - val) * alpha + val
+        out[i] = val
+
+
 class EMA(Indicator):
     """Exponential Moving Average.
 
@@ -50,6 +70,12 @@ class EMA(Indicator):
     def value(self) -> Optional[float]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        src = arrays.get(self.source, arrays["close"])
+        out = np.empty(len(src), dtype=np.float64)
+        _ema_loop(src, self._multiplier, out)
+        return out
+
     def reset(self) -> None:
         super().reset()
         self._value = None
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+import numpy as np
+
 from ..data.types import Bar
 from .base import Indicator
-from .ema import EMA
+from .ema import EMA, _ema_loop
 
 
 class MACD(Indicator):
@@ -91,6 +93,28 @@ class MACD(Indicator):
     def value(self) -> Optional[Dict[str, float]]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        src = arrays.get(self.source, arrays["close"])
+        n = len(src)
+        fast = np.empty(n)
+        slow = np.empty(n)
+        _ema_loop(src, self._fast_ema._multiplier, fast)
+        _ema_loop(src, self._slow_ema._multiplier, slow)
+
+        macd_line = np.full(n, np.nan)
+        signal = np.full(n, np.nan)
+        # First bar where both EMAs are ready
+        start = max(self.fast_period, self.slow_period) - 1
+        if start < n:
+            macd_line[start:] = fast[start:] - slow[start:]
+            _ema_loop(macd_line[start:], self._signal_multiplier, signal[start:])
+
+        return {
+            "macd": macd_line,
+            "signal": signal,
+            "histogram": macd_line - signal,
+        }
+
     def reset(self) -> None:
         super().reset()
         self._fast_ema.reset()
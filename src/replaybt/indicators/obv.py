@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+import numpy as np
+
 from ..data.types import Bar
 from .base import Indicator
 
@@ -39,6 +41,16 @@ class OBV(Indicator):
     def value(self) -> float:
         return self._obv
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        close = arrays["close"]
+        volume = arrays["volume"]
+        out = np.zeros(len(close))
+        if len(close) > 1:
+            diff = np.diff(close)
+            signed = np.where(diff > 0, volume[1:], np.where(diff < 0, -volume[1:], 0.0))
+            np.cumsum(signed, out=out[1:])
+        return out
+
     def reset(self) -> None:
         super().reset()
         self._prev_close = None
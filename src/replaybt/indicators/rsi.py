@@ -5,10 +5,84 @@ from __future__ import annotations
 from collections import deque
 from typing import Any, Dict, Optional
 
+import numpy as np
+
+from .._njit import njit
 from ..data.types import Bar
 from .base import Indicator
 
 
+@njit(cache=True)
+def _rsi_loop(src, period, wilder, out):
+    """Fill ``out`` with RSI of ``src`` (NaN until warm).
+
+    Mirrors RSI.update(): the first bar only seeds the previous close,
+    Wilder mode includes pandas' phantom 0-gain/0-loss step.
+    """
+    n = src.shape[0]
+    if n == 0:
+        return
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    value = np.nan
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    # Simple mode: running window sums + counts of non-zero entries
+    sum_gain = 0.0
+    sum_loss = 0.0
+    n_gain = 0
+    n_loss = 0
+    out[0] = np.nan
+    for i in range(1, n):
+        delta = src[i] - src[i - 1]
+        gain = 0.0 if 0.0 > delta else delta
+        loss = 0.0 if 0.0 > -delta else -delta
+        gains[i] = gain
+        losses[i] = loss
+        count = i
+
+        if wilder:
+            if count == 1:
+                avg_gain = alpha * gain
+                avg_loss = alpha * loss
+            else:
+                avg_gain = alpha * gain + (1 - alpha) * avg_gain
+                avg_loss = alpha * loss + (1 - alpha) * avg_loss
+            if count >= period - 1:
+                if avg_loss == 0:
+                    value = 100.0
+                else:
+                    rs = avg_gain / avg_loss
+                    value = 100 - (100 / (1 + rs))
+        else:
+            if count > period:
+                old_gain = gains[i - period]
+                old_loss = losses[i - period]
+                sum_gain -= old_gain
+                sum_loss -= old_loss
+                n_gain -= old_gain != 0.0
+                n_loss -= old_loss != 0.0
+            sum_gain += gain
+            sum_loss += loss
+            n_gain += gain != 0.0
+            n_loss += loss != 0.0
+            # An all-zero window is exactly zero (drops rounding residue)
+            if n_gain == 0:
+                sum_gain = 0.0
+            if n_loss == 0:
+                sum_loss = 0.0
+            if count >= period:
+                avg_g = sum_gain / period
+                avg_l = sum_loss / period
+                if avg_l == 0:
+                    value = 100.0
+                else:
+                    rs = avg_g / avg_l
+                    value = 100 - (100 / (1 + rs))
+        out[i] = value
+
+
 class RSI(Indicator):
     """Relative Strength Index.
 
@@ -44,6 +118,10 @@ class RSI(Indicator):
         # For simple mode: rolling windows
         self._gains: deque = deque(maxlen=period)
         self._losses: deque = deque(maxlen=period)
+        self._sum_gain = 0.0
+        self._sum_loss = 0.0
+        self._n_gain = 0
+        self._n_loss = 0
 
     @classmethod
     def from_config(cls, name: str, config: Dict) -> "RSI":
@@ -107,15 +185,32 @@ class RSI(Indicator):
             self._ready = True
 
     def _update_simple(self, gain: float, loss: float) -> None:
-        """Simple rolling average RSI."""
+        """Simple rolling average RSI (O(1) running window sums)."""
+        if len(self._gains) == self.period:
+            old_gain = self._gains[0]
+            old_loss = self._losses[0]
+            self._sum_gain -= old_gain
+            self._sum_loss -= old_loss
+            self._n_gain -= old_gain != 0.0
+            self._n_loss -= old_loss != 0.0
+
         self._gains.append(gain)
         self._losses.append(loss)
+        self._sum_gain += gain
+        self._sum_loss += loss
+        self._n_gain += gain != 0.0
+        self._n_loss += loss != 0.0
+        # An all-zero window is exactly zero (drops rounding residue)
+        if self._n_gain == 0:
+            self._sum_gain = 0.0
+        if self._n_loss == 0:
+            self._sum_loss = 0.0
 
         if len(self._gains) < self.period:
             return
 
-        avg_gain = sum(self._gains) / self.period
-        avg_loss = sum(self._losses) / self.period
+        avg_gain = self._sum_gain / self.period
+        avg_loss = self._sum_loss / self.period
 
         if avg_loss == 0:
             self._value = 100.0
@@ -128,6 +223,12 @@ class RSI(Indicator):
     def value(self) -> Optional[float]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        src = arrays.get(self.source, arrays["close"])
+        out = np.empty(len(src), dtype=np.float64)
+        _rsi_loop(src, self.period, self.mode == "wilder", out)
+        return out
+
     @property
     def avg_gain(self) -> float:
         return self._avg_gain
@@ -145,3 +246,7 @@ class RSI(Indicator):
         self._count = 0
         self._gains.clear()
         self._losses.clear()
+        self._sum_gain = 0.0
+        self._sum_loss = 0.0
+        self._n_gain = 0
+        self._n_loss = 0
@@ -5,10 +5,27 @@ from __future__ import annotations
 from collections import deque
 from typing import Any, Dict, Optional
 
+import numpy as np
+
+from .._njit import njit
 from ..data.types import Bar
 from .base import Indicator
 
 
+@njit(cache=True)
+def _sma_loop(src, period, out):
+    """Fill ``out`` with the rolling mean of ``src`` (NaN until warm)."""
+    total = 0.0
+    for i in range(src.shape[0]):
+        if i >= period:
+            total -= src[i - period]
+        total += src[i]
+        if i >= period - 1:
+            out[i] = total / period
+        else:
+            out[i] = np.nan
+
+
 class SMA(Indicator):
     """Simple Moving Average.
 
@@ -49,6 +66,12 @@ class SMA(Indicator):
     def value(self) -> Optional[float]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        src = arrays.get(self.source, arrays["close"])
+        out = np.empty(len(src), dtype=np.float64)
+        _sma_loop(src, self.period, out)
+        return out
+
     def reset(self) -> None:
         super().reset()
         self._window.clear()
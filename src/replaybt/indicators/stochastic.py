@@ -5,7 +5,10 @@ from __future__ import annotations
 from collections import deque
 from typing import Any, Dict, Optional
 
+import numpy as np
+
 from ..data.types import Bar
+from ._rolling import rolling_max, rolling_mean, rolling_min
 from .base import Indicator
 
 
@@ -36,10 +39,13 @@ class Stochastic(Indicator):
         self.d_period = d_period
         self.smooth_k = smooth_k
 
-        self._highs: deque = deque(maxlen=k_period)
-        self._lows: deque = deque(maxlen=k_period)
+        self._count = 0
+        self._highs: deque = deque()
+        self._lows: deque = deque()
         self._raw_k: deque = deque(maxlen=smooth_k)
         self._k_values: deque = deque(maxlen=d_period)
+        self._raw_k_sum = 0.0
+        self._k_sum = 0.0
         self._value: Optional[Dict[str, float]] = None
 
     @classmethod
@@ -52,14 +58,28 @@ class Stochastic(Indicator):
         )
 
     def update(self, bar: Bar) -> None:
-        self._highs.append(bar.high)
-        self._lows.append(bar.low)
-
-        if len(self._highs) < self.k_period:
+        i = self._count
+        self._count += 1
+        k_period = self.k_period
+
+        # Monotonic deques of (index, price): front is the window max/min
+        highs, lows = self._highs, self._lows
+        while highs and highs[-1][1] <= bar.high:
+            highs.pop()
+        highs.append((i, bar.high))
+        if highs[0][0] <= i - k_period:
+            highs.popleft()
+        while lows and lows[-1][1] >= bar.low:
+            lows.pop()
+        lows.append((i, bar.low))
+        if lows[0][0] <= i - k_period:
+            lows.popleft()
+
+        if self._count < k_period:
             return
 
-        highest = max(self._highs)
-        lowest = min(self._lows)
+        highest = highs[0][1]
+        lowest = lows[0][1]
 
         if highest == lowest:
             raw_k = 50.0
@@ -67,25 +87,59 @@ class Stochastic(Indicator):
             raw_k = (bar.close - lowest) / (highest - lowest) * 100
 
         # Smooth %K
-        self._raw_k.append(raw_k)
+        self._raw_k_sum += self._slide(self._raw_k, raw_k, self.smooth_k)
         if len(self._raw_k) < self.smooth_k:
             return
-        k = sum(self._raw_k) / self.smooth_k
+        k = self._raw_k_sum / self.smooth_k
 
         # %D = SMA of %K
-        self._k_values.append(k)
+        self._k_sum += self._slide(self._k_values, k, self.d_period)
         if len(self._k_values) < self.d_period:
             self._value = {"k": k, "d": k}
             self._ready = True
             return
 
-        d = sum(self._k_values) / self.d_period
+        d = self._k_sum / self.d_period
         self._value = {"k": k, "d": d}
         self._ready = True
 
+    @staticmethod
+    def _slide(window: deque, x: float, size: int) -> float:
+        """Append x to a bounded window; return the change in its sum."""
+        dropped = window[0] if len(window) == size else 0.0
+        window.append(x)
+        return x - dropped
+
     def value(self) -> Optional[Dict[str, float]]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        close = arrays["close"]
+        n = len(close)
+        highest = rolling_max(arrays["high"], self.k_period)
+        lowest = rolling_min(arrays["low"], self.k_period)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw_k = np.where(
+                highest == lowest, 50.0,
+                (close - lowest) / (highest - lowest) * 100,
+            )
+        raw_k[np.isnan(highest)] = np.nan
+
+        # Smoothing windows start at the first raw %K, not at bar 0
+        k = np.full(n, np.nan)
+        d = np.full(n, np.nan)
+        first = self.k_period - 1
+        if first < n:
+            k[first:] = rolling_mean(raw_k[first:], self.smooth_k)
+            k_first = first + self.smooth_k - 1
+            if k_first < n:
+                d[k_first:] = rolling_mean(k[k_first:], self.d_period)
+                # Until d_period %K values exist, %D mirrors %K
+                partial = slice(k_first, min(k_first + self.d_period - 1, n))
+                d[partial] = k[partial]
+
+        return {"k": k, "d": d}
+
     @property
     def k(self) -> Optional[float]:
         return self._value["k"] if self._value else None
@@ -100,4 +154,7 @@ class Stochastic(Indicator):
         self._lows.clear()
         self._raw_k.clear()
         self._k_values.clear()
+        self._raw_k_sum = 0.0
+        self._k_sum = 0.0
+        self._count = 0
         self._value = None
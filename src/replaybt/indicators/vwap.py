@@ -4,9 +4,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+import numpy as np
+
 from ..data.types import Bar
+from ._rolling import ffill
 from .base import Indicator
 
+_NS_PER_DAY = 86_400 * 10**9
+
 
 class VWAP(Indicator):
     """Volume Weighted Average Price.
@@ -50,6 +55,29 @@ class VWAP(Indicator):
     def value(self) -> Optional[float]:
         return self._value
 
+    def precompute(self, arrays: Dict[str, np.ndarray]) -> Optional[np.ndarray]:
+        ts = arrays.get("timestamp")
+        if ts is None:
+            return None  # Needs timestamps for the daily reset
+
+        tp = (arrays["high"] + arrays["low"] + arrays["close"]) / 3
+        tp_vol = tp * arrays["volume"]
+        cum_tp_vol = np.empty_like(tp_vol)
+        cum_vol = np.empty_like(tp_vol)
+
+        # Cumulative sums restart at each UTC day boundary
+        days = ts // _NS_PER_DAY
+        bounds = np.flatnonzero(np.diff(days)) + 1
+        for seg in np.split(np.arange(len(days)), bounds):
+            if len(seg):
+                np.cumsum(tp_vol[seg], out=cum_tp_vol[seg[0]:seg[-1] + 1])
+                np.cumsum(arrays["volume"][seg], out=cum_vol[seg[0]:seg[-1] + 1])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = np.where(cum_vol > 0, cum_tp_vol / cum_vol, np.nan)
+        # Zero-volume stretches keep the last value
+        return ffill(vwap)
+
     def reset(self) -> None:
         super().reset()
         self._cum_vol = 0.0
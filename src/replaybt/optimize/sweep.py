@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import itertools
-from multiprocessing import Pool, cpu_count
-from typing import Dict, List, Optional, Type
+import pickle
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from multiprocessing import cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
+import numpy as np
+
+from ..data.columns import to_epoch_ns
 from ..data.providers.base import DataProvider
 from ..data.types import Bar
 from ..engine.loop import BacktestEngine
@@ -34,7 +41,10 @@ class _ListProvider(DataProvider):
 def _run_single_combo(args) -> dict:
     """Run one backtest combo. Module-level for multiprocessing pickling."""
     strategy_class, bars, symbol, timeframe, base_config, params = args
+    return _run_combo(strategy_class, bars, symbol, timeframe, base_config, params)
+
 
+def _run_combo(strategy_class, bars, symbol, timeframe, base_config, params) -> dict:
     config = {**base_config, **params}
 
     provider = _ListProvider(bars, symbol, timeframe)
@@ -56,12 +66,88 @@ def _run_single_combo(args) -> dict:
     }
 
 
+# ---------------------------------------------------------------------------
+# Shared-memory bar transport for worker processes
+# ---------------------------------------------------------------------------
+
+# Columns after the int64 timestamp row, in Bar field order
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+
+# Per-process state set by _init_worker()
+_WORKER: Dict[str, Any] = {}
+
+
+def _bars_to_shm(bars: List[Bar]) -> SharedMemory:
+    """Copy bar fields into one shared block: int64 ns timestamps + float64 OHLCV."""
+    n = len(bars)
+    shm = SharedMemory(create=True, size=max(n * 8 * (1 + len(_PRICE_FIELDS)), 1))
+    ts, prices = _shm_views(shm, n)
+    ts[:] = [to_epoch_ns(b.timestamp) for b in bars]
+    for row, field in enumerate(_PRICE_FIELDS):
+        prices[row] = [getattr(b, field) for b in bars]
+    return shm
+
+
+def _shm_views(shm: SharedMemory, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    ts = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+    prices = np.ndarray(
+        (len(_PRICE_FIELDS), n), dtype=np.float64, buffer=shm.buf, offset=n * 8,
+    )
+    return ts, prices
+
+
+def _bars_from_arrays(ts, prices, tz, bar_symbol: str, bar_tf: str) -> List[Bar]:
+    epoch = _EPOCH_NAIVE if tz is None else datetime(1970, 1, 1, tzinfo=timezone.utc)
+    us = timedelta(microseconds=1)
+    stamps = [epoch + (t // 1000) * us for t in ts.tolist()]
+    if tz is not None:
+        stamps = [dt.astimezone(tz) for dt in stamps]
+    return [
+        Bar(dt, o, h, l, c, v, bar_symbol, bar_tf)
+        for dt, o, h, l, c, v in zip(stamps, *(row.tolist() for row in prices))
+    ]
+
+
+def _init_worker(
+    shm_name: str, n_bars: int, bar_meta: tuple, task_bytes: bytes,
+) -> None:
+    """Attach to the shared bar block and rebuild bars once per worker."""
+    shm = SharedMemory(name=shm_name)
+    try:
+        ts, prices = _shm_views(shm, n_bars)
+        bars = _bars_from_arrays(ts, prices, *bar_meta)
+        del ts, prices
+    finally:
+        shm.close()
+
+    strategy_class, symbol, timeframe, base_config = pickle.loads(task_bytes)
+    _WORKER.update(
+        bars=bars,
+        strategy_class=strategy_class,
+        symbol=symbol,
+        timeframe=timeframe,
+        base_config=base_config,
+    )
+
+
+def _run_params(params: dict) -> dict:
+    """Run one combo against the bars loaded by _init_worker()."""
+    w = _WORKER
+    return _run_combo(
+        w["strategy_class"], w["bars"], w["symbol"], w["timeframe"],
+        w["base_config"], params,
+    )
+
+
 class ParameterSweep:
     """Parallel parameter grid search.
 
     Runs BacktestEngine for each parameter combination in parallel
-    using multiprocessing. Strategies read swept params from config
-    via configure().
+    using a process pool. Bars are placed in shared memory once and
+    rebuilt once per worker; each task only carries its param dict.
+    Strategies read swept params from config via configure().
 
     Usage:
         sweep = ParameterSweep(
@@ -99,14 +185,22 @@ class ParameterSweep:
         self._param_grid = param_grid
         self._n_workers = n_workers
 
-    def _build_combos(self) -> List[dict]:
-        """Build all parameter combinations from the grid."""
+    def _iter_combos(self) -> Iterator[dict]:
+        """Yield parameter combinations lazily, in sorted-key grid order."""
         keys = sorted(self._param_grid.keys())
         values = [self._param_grid[k] for k in keys]
-        return [
-            dict(zip(keys, combo))
-            for combo in itertools.product(*values)
-        ]
+        for combo in itertools.product(*values):
+            yield dict(zip(keys, combo))
+
+    def _n_combos(self) -> int:
+        n = 1
+        for values in self._param_grid.values():
+            n *= len(values)
+        return n
+
+    def _build_combos(self) -> List[dict]:
+        """Build all parameter combinations from the grid."""
+        return list(self._iter_combos())
 
     def run(self) -> SweepResults:
         """Run all combos in parallel. Returns SweepResults."""
@@ -114,23 +208,62 @@ class ParameterSweep:
         symbol = self._data.symbol()
         timeframe = self._data.timeframe()
 
-        combos = self._build_combos()
-
-        worker_args = [
-            (
-                self._strategy_class, bars, symbol, timeframe,
-                self._base_config, combo,
-            )
-            for combo in combos
-        ]
-
         n = self._n_workers or cpu_count()
+        n_combos = self._n_combos()
 
-        if n == 1:
+        if n == 1 or n_combos <= 1 or not bars:
             # Single-worker: skip multiprocessing overhead
-            raw_results = [_run_single_combo(a) for a in worker_args]
-        else:
-            with Pool(n) as pool:
-                raw_results = pool.map(_run_single_combo, worker_args)
+            raw_results = [
+                _run_combo(
+                    self._strategy_class, bars, symbol, timeframe,
+                    self._base_config, combo,
+                )
+                for combo in self._iter_combos()
+            ]
+            return SweepResults(combos=raw_results)
+
+        # Bars go to workers once through shared memory; strategy class and
+        # base_config are pickled once here and unpickled once per worker,
+        # so tasks carry only the swept params.
+        first = bars[0]
+        bar_meta = (first.timestamp.tzinfo, first.symbol, first.timeframe)
+        task_bytes = pickle.dumps(
+            (self._strategy_class, symbol, timeframe, self._base_config),
+            protocol=5,
+        )
+        n_workers = min(n, n_combos)
+        shm = _bars_to_shm(bars)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(shm.name, len(bars), bar_meta, task_bytes),
+            ) as executor:
+                raw_results = _submit_bounded(
+                    executor, self._iter_combos(), max_pending=2 * n_workers,
+                )
+        finally:
+            shm.close()
+            shm.unlink()
 
         return SweepResults(combos=raw_results)
+
+
+def _submit_bounded(executor, combos: Iterator[dict], max_pending: int) -> List[dict]:
+    """Stream combos into the pool with at most ``max_pending`` in flight.
+
+    Combos are pulled from the generator only as slots free up, so large
+    grids never materialize a full task list. Results keep grid order.
+    """
+    results: List[Optional[dict]] = []
+    pending: Dict[Any, int] = {}
+    for combo in combos:
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                results[pending.pop(fut)] = fut.result()
+        pending[executor.submit(_run_params, combo)] = len(results)
+        results.append(None)
+    for fut in pending:
+        results[pending[fut]] = fut.result()
+    return results
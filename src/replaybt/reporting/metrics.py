@@ -3,11 +3,57 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from .._njit import njit
 from ..data.types import Bar, Trade
-from .monthly import MonthStats, monthly_breakdown, format_monthly_table
+from .monthly import (
+    MonthStats,
+    format_monthly_table,
+    monthly_breakdown,
+    monthly_breakdown_columns,
+)
+
+
+@njit(cache=True)
+def _trade_stats(pnl_usd, pnl_pct):
+    """Win count and win/loss sums over the trade columns in one pass.
+
+    A trade wins when ``pnl_usd > 0``. Returns ``(n_win, gross_profit,
+    gross_loss, win_pct_sum, loss_pct_sum)``; the loss sums are
+    magnitudes.
+    """
+    n_win = 0
+    gross_profit = 0.0
+    loss_sum = 0.0
+    win_pct_sum = 0.0
+    loss_pct_sum = 0.0
+    for i in range(len(pnl_usd)):
+        if pnl_usd[i] > 0:
+            n_win += 1
+            gross_profit += pnl_usd[i]
+            win_pct_sum += pnl_pct[i]
+        else:
+            loss_sum += pnl_usd[i]
+            loss_pct_sum += pnl_pct[i]
+    return n_win, gross_profit, abs(loss_sum), win_pct_sum, abs(loss_pct_sum)
+
+
+def _monthly(trades: List[Trade], cols) -> List[MonthStats]:
+    """Monthly stats, bucketed straight from the trade columns when possible.
+
+    The columns hold UTC epoch timestamps, so they are only used when
+    exit times are naive or UTC; other zones bucket by wall-clock month.
+    """
+    tz = trades[0].exit_time.tzinfo
+    if cols is not None and (tz is None or tz.utcoffset(None) == timedelta(0)):
+        return monthly_breakdown_columns(
+            cols.column("exit_ts"), cols.column("pnl_usd"), cols.column("fees"),
+        )
+    return monthly_breakdown(trades)
 
 
 @dataclass
@@ -82,13 +128,19 @@ class BacktestResults:
                 last_price=last_price,
             )
 
-        winners = [t for t in trades if t.pnl_usd > 0]
-        losers = [t for t in trades if t.pnl_usd <= 0]
-        n_win = len(winners)
-        n_lose = len(losers)
-
-        gross_profit = sum(t.pnl_usd for t in winners) if winners else 0.0
-        gross_loss = abs(sum(t.pnl_usd for t in losers)) if losers else 0.0
+        cols = portfolio.trade_columns
+        synced = len(cols) == total
+        if synced:
+            pnl_usd = cols.column("pnl_usd")
+            pnl_pct = cols.column("pnl_pct")
+        else:
+            # trades list was edited outside the Portfolio API
+            pnl_usd = np.fromiter((t.pnl_usd for t in trades), np.float64, total)
+            pnl_pct = np.fromiter((t.pnl_pct for t in trades), np.float64, total)
+        n_win, gross_profit, gross_loss, win_pct_sum, loss_pct_sum = _trade_stats(
+            pnl_usd, pnl_pct,
+        )
+        n_lose = total - n_win
 
         # Exit reason breakdown
         breakdown: Dict[str, int] = {}
@@ -112,8 +164,8 @@ class BacktestResults:
             win_rate=n_win / total * 100 if total else 0,
             avg_win=gross_profit / n_win if n_win else 0,
             avg_loss=gross_loss / n_lose if n_lose else 0,
-            avg_win_pct=sum(t.pnl_pct for t in winners) / n_win * 100 if n_win else 0,
-            avg_loss_pct=abs(sum(t.pnl_pct for t in losers)) / n_lose * 100 if n_lose else 0,
+            avg_win_pct=win_pct_sum / n_win * 100 if n_win else 0,
+            avg_loss_pct=loss_pct_sum / n_lose * 100 if n_lose else 0,
             profit_factor=gross_profit / gross_loss if gross_loss > 0 else float("inf"),
             total_fees=portfolio.total_fees,
             trades=list(trades),
@@ -122,7 +174,7 @@ class BacktestResults:
             buy_hold_return_pct=buy_hold_return,
             first_price=first_price,
             last_price=last_price,
-            monthly=monthly_breakdown(trades),
+            monthly=_monthly(trades, cols if synced else None),
         )
 
     def summary(self) -> str:
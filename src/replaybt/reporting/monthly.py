@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import List
+
+import numpy as np
 
 from ..data.types import Trade
 
@@ -36,7 +37,8 @@ class MonthStats:
 def monthly_breakdown(trades: List[Trade]) -> List[MonthStats]:
     """Compute per-month statistics from a list of trades.
 
-    Groups trades by exit month (since that's when PnL is realized).
+    Groups trades by exit month (since that's when PnL is realized),
+    in the exit timestamp's own wall-clock time.
 
     Returns:
         List of MonthStats sorted chronologically.
@@ -44,28 +46,74 @@ def monthly_breakdown(trades: List[Trade]) -> List[MonthStats]:
     if not trades:
         return []
 
-    months: Dict[Tuple[int, int], MonthStats] = {}
-
-    for t in trades:
-        key = (t.exit_time.year, t.exit_time.month)
-        if key not in months:
-            months[key] = MonthStats(year=key[0], month=key[1])
-        m = months[key]
+    n = len(trades)
+    month_id = np.fromiter(
+        (t.exit_time.year * 12 + t.exit_time.month - 1 for t in trades),
+        np.int64, n,
+    )
+    pnl = np.fromiter((t.pnl_usd for t in trades), np.float64, n)
+    fees = np.fromiter((t.fees for t in trades), np.float64, n)
+    return _bucket(month_id, pnl, fees)
 
-        m.trades += 1
-        m.fees += t.fees
-        m.net_pnl += t.pnl_usd
 
-        if t.pnl_usd > 0:
-            m.wins += 1
-            m.gross_profit += t.pnl_usd
-            m.max_win = max(m.max_win, t.pnl_usd)
-        else:
-            m.losses += 1
-            m.gross_loss += abs(t.pnl_usd)
-            m.max_loss = min(m.max_loss, t.pnl_usd)
+def monthly_breakdown_columns(
+    exit_ts: np.ndarray,
+    pnl_usd: np.ndarray,
+    fees: np.ndarray,
+) -> List[MonthStats]:
+    """monthly_breakdown() over trade columns (see data.columns.TRADE_DTYPE).
 
-    return sorted(months.values(), key=lambda m: (m.year, m.month))
+    Args:
+        exit_ts: int64 exit timestamps, epoch nanoseconds (UTC months).
+        pnl_usd: float64 realized PnL per trade.
+        fees: float64 fees per trade.
+    """
+    if len(exit_ts) == 0:
+        return []
+    month_id = (
+        np.asarray(exit_ts, dtype=np.int64)
+        .astype("datetime64[ns]")
+        .astype("datetime64[M]")
+        .view(np.int64)
+    ) + 1970 * 12
+    return _bucket(month_id, pnl_usd, fees)
+
+
+def _bucket(month_id: np.ndarray, pnl: np.ndarray, fees: np.ndarray) -> List[MonthStats]:
+    """Aggregate per-trade columns by ``year * 12 + month - 1`` bucket."""
+    months, idx = np.unique(month_id, return_inverse=True)
+    k = len(months)
+    win = pnl > 0
+    lose = ~win
+
+    trades = np.bincount(idx, minlength=k)
+    wins = np.bincount(idx, weights=win, minlength=k)
+    gross_profit = np.bincount(idx, weights=np.where(win, pnl, 0.0), minlength=k)
+    gross_loss = np.bincount(idx, weights=np.where(lose, np.abs(pnl), 0.0), minlength=k)
+    net_pnl = np.bincount(idx, weights=pnl, minlength=k)
+    fee_sum = np.bincount(idx, weights=fees, minlength=k)
+    max_win = np.zeros(k)
+    np.maximum.at(max_win, idx[win], pnl[win])
+    max_loss = np.zeros(k)
+    np.minimum.at(max_loss, idx[lose], pnl[lose])
+
+    out = []
+    for j, mid in enumerate(months.tolist()):
+        n_win = int(wins[j])
+        out.append(MonthStats(
+            year=mid // 12,
+            month=mid % 12 + 1,
+            trades=int(trades[j]),
+            wins=n_win,
+            losses=int(trades[j]) - n_win,
+            gross_profit=float(gross_profit[j]),
+            gross_loss=float(gross_loss[j]),
+            net_pnl=float(net_pnl[j]),
+            fees=float(fee_sum[j]),
+            max_win=float(max_win[j]),
+            max_loss=float(max_loss[j]),
+        ))
+    return out
 
 
 def format_monthly_table(
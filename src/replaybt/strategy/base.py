@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from ..data.types import Bar, Fill, Position, Trade
 from ..engine.orders import Order, CancelPendingLimitsOrder
 
+if TYPE_CHECKING:
+    from ..indicators.base import IndicatorManager
+
 
 class Strategy(ABC):
     """Abstract base for all strategies.
@@ -18,6 +21,7 @@ class Strategy(ABC):
 
     Lifecycle:
         1. configure(config) — called once before run
+        1b. prepare(indicators) — called at the start of each run
         2. on_bar(bar, indicators, positions) — called per bar
         3. on_fill(fill) — called when an order fills
         4. on_exit(fill, trade) — called when a position closes
@@ -55,6 +59,16 @@ class Strategy(ABC):
         """
         pass
 
+    def prepare(self, indicators: "IndicatorManager") -> None:
+        """Called by BacktestEngine.run() before the first bar.
+
+        When the data supports batch mode, ``indicators`` already holds
+        the full precomputed series (see IndicatorManager.batch_series()
+        and .cursor), so a strategy can vectorize its signal logic here.
+        Override to precompute; the default does nothing.
+        """
+        pass
+
     def on_fill(self, fill: Fill) -> Optional[Order]:
         """Called when an order fills (entry or merge).
 
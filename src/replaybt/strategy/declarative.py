@@ -11,10 +11,14 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
+from .._njit import njit
 from ..data.types import Bar, Fill, Position, Side, Trade
 from ..engine.orders import MarketOrder, LimitOrder, Order, CancelPendingLimitsOrder
 from .base import Strategy
@@ -166,6 +170,132 @@ def parse_conditions(raw_list: List[dict]) -> List[Condition]:
     return [parse_condition(r) for r in raw_list]
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_conditions_cached(key: str) -> Tuple[Condition, ...]:
+    return tuple(parse_conditions(json.loads(key)))
+
+
+def _compile_conditions(raw_list: List[dict]) -> List[Condition]:
+    """parse_conditions() memoized on the canonical JSON of the list.
+
+    Conditions are frozen dataclasses, so instances built from the same
+    config (e.g. one per sweep combo) can share them.
+    """
+    try:
+        key = json.dumps(raw_list, sort_keys=True)
+    except TypeError:
+        return parse_conditions(raw_list)  # Not JSON-serializable: no memo
+    return list(_parse_conditions_cached(key))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_source(content: bytes) -> dict:
+    return json.loads(content)
+
+
+# ── Batch compilation ────────────────────────────────────────────────────
+
+
+def _condition_source(cond: Condition, operand) -> str:
+    """Emit the per-bar boolean expression for one condition.
+
+    Mirrors evaluate_condition(): NaN operands (None in the scalar path)
+    compare False, and conditions that need the previous bar are False
+    at index 0.
+    """
+    if isinstance(cond, CrossoverCondition):
+        f, sl = operand(cond.fast), operand(cond.slow)
+        now, prev = (">", "<=") if not cond.is_crossunder else ("<", ">=")
+        return (
+            f"(i > 0 and {f}[i] {now} {sl}[i] "
+            f"and {f}[i - 1] {prev} {sl}[i - 1])"
+        )
+    if isinstance(cond, CompareCondition):
+        op = ">" if cond.op == "above" else "<"
+        return f"({operand(cond.left)}[i] {op} {operand(cond.right)}[i])"
+    if isinstance(cond, ThresholdCondition):
+        x = operand(cond.indicator)
+        v = repr(float(cond.value))
+        if cond.op == "above_threshold":
+            return f"({x}[i] > {v})"
+        if cond.op == "below_threshold":
+            return f"({x}[i] <= {v})"
+        if cond.op == "crosses_above":
+            return f"(i > 0 and {x}[i] > {v} and {x}[i - 1] <= {v})"
+        if cond.op == "crosses_below":
+            return f"(i > 0 and {x}[i] < {v} and {x}[i - 1] >= {v})"
+    return "False"
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_kernel(conditions: Tuple[Condition, ...]) -> Tuple[Callable, Tuple[str, ...]]:
+    operands: List[str] = []
+
+    def operand(name: str) -> str:
+        if name not in operands:
+            operands.append(name)
+        return f"a{operands.index(name)}"
+
+    exprs = [_condition_source(c, operand) for c in conditions] or ["False"]
+    args = ", ".join([f"a{k}" for k in range(len(operands))] + ["out"])
+    body = " and ".join(exprs)
+    source = (
+        f"def _signal_kernel({args}):\n"
+        f"    for i in range(out.shape[0]):\n"
+        f"        out[i] = {body}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    # No cache=True: exec'd functions have no source file for Numba to key on
+    return njit(namespace["_signal_kernel"]), tuple(operands)
+
+
+def compile_to_njit(
+    conditions: List[Condition],
+) -> Tuple[Callable, Tuple[str, ...]]:
+    """Lower an AND-chain of conditions to one JIT-compiled loop.
+
+    The generated kernel takes one float64 array per operand (in the
+    returned order) plus a bool ``out`` array, and sets ``out[i]`` to
+    what evaluate_all() would return at bar ``i`` given the previous
+    bar's values. Compiled kernels are memoized per condition list.
+
+    Returns:
+        (kernel, operand_names). Operand names are indicator names or
+        'bar.<field>' references.
+    """
+    return _compile_kernel(tuple(conditions))
+
+
+def compute_signal(
+    conditions: List[Condition],
+    resolve: Callable[[str], Optional[np.ndarray]],
+    n: int,
+) -> Optional[np.ndarray]:
+    """Evaluate an AND-chain over whole series.
+
+    Args:
+        conditions: Parsed conditions.
+        resolve: Maps an operand name to its float64 series (length n),
+            or None if it is not available in batch form.
+        n: Number of bars.
+
+    Returns:
+        bool array of per-bar results, or None if any operand could not
+        be resolved.
+    """
+    kernel, operands = compile_to_njit(conditions)
+    arrays = []
+    for name in operands:
+        arr = resolve(name)
+        if arr is None:
+            return None
+        arrays.append(arr)
+    out = np.zeros(n, dtype=np.bool_)
+    kernel(*arrays, out)
+    return out
+
+
 # ── DeclarativeStrategy ─────────────────────────────────────────────────
 
 
@@ -173,8 +303,10 @@ class DeclarativeStrategy(Strategy):
     """JSON config to Strategy. No code required.
 
     Parses conditions once at init into typed dataclasses. Evaluates
-    them each bar using standalone functions. Builds orders from the
-    exit/scale_in config sections.
+    them each bar using standalone functions, or, when the engine runs
+    in batch mode, compiles them once per run into signal arrays that
+    on_bar() indexes. Builds orders from the exit/scale_in config
+    sections.
 
     Args:
         config: Parsed JSON configuration dict.
@@ -188,8 +320,8 @@ class DeclarativeStrategy(Strategy):
         entry = config.get("entry", {})
         long_raw = entry.get("long", {}).get("conditions", [])
         short_raw = entry.get("short", {}).get("conditions", [])
-        self._long_conds = parse_conditions(long_raw)
-        self._short_conds = parse_conditions(short_raw)
+        self._long_conds = _compile_conditions(long_raw)
+        self._short_conds = _compile_conditions(short_raw)
 
         # Exit config
         self._exit = config.get("exit", {})
@@ -200,16 +332,52 @@ class DeclarativeStrategy(Strategy):
         # Previous indicator values for crossover detection
         self._prev_values: Dict[str, Any] = {}
 
+        # Batch-mode signals (set by prepare())
+        self._batch_manager = None
+        self._long_signal: Optional[np.ndarray] = None
+        self._short_signal: Optional[np.ndarray] = None
+        self._last_index = -1
+
     def indicator_config(self) -> dict:
         """Return indicator config for IndicatorManager."""
         return self._config.get("indicators", {})
 
+    def prepare(self, indicators) -> None:
+        """Compile entry conditions to signal arrays when in batch mode."""
+        self._batch_manager = None
+        self._long_signal = None
+        self._short_signal = None
+        self._last_index = -1
+
+        arrays = indicators.batch_arrays
+        if arrays is None:
+            return
+
+        def resolve(name: str) -> Optional[np.ndarray]:
+            if name.startswith("bar."):
+                return arrays.get(name[4:]) if name[4:] != "timestamp" else None
+            return indicators.batch_series(name)
+
+        n = len(arrays["close"])
+        long_sig = compute_signal(self._long_conds, resolve, n)
+        short_sig = compute_signal(self._short_conds, resolve, n)
+        if long_sig is None or short_sig is None:
+            return  # Some operand only exists per bar: stay scalar
+        self._batch_manager = indicators
+        self._long_signal = long_sig
+        self._short_signal = short_sig
+
     def on_bar(
         self,
         bar: Bar,
         indicators: Dict[str, Any],
         positions: List[Position],
     ) -> Optional[Order]:
+        # Signal arrays assume the previous call saw the previous bar
+        i = self._batch_manager.cursor if self._batch_manager is not None else -1
+        batch = self._long_signal is not None and i == self._last_index + 1
+        self._last_index = i
+
         # Skip if already in a position
         if positions:
             self._prev_values = dict(indicators)
@@ -217,9 +385,20 @@ class DeclarativeStrategy(Strategy):
 
         order = None
 
-        if evaluate_all(self._long_conds, bar, indicators, self._prev_values):
+        if batch:
+            go_long = self._long_signal[i]
+            go_short = self._short_signal[i]
+        else:
+            go_long = evaluate_all(
+                self._long_conds, bar, indicators, self._prev_values,
+            )
+            go_short = not go_long and evaluate_all(
+                self._short_conds, bar, indicators, self._prev_values,
+            )
+
+        if go_long:
             order = self._build_order(Side.LONG)
-        elif evaluate_all(self._short_conds, bar, indicators, self._prev_values):
+        elif go_short:
             order = self._build_order(Side.SHORT)
 
         self._prev_values = dict(indicators)
@@ -285,9 +464,14 @@ class DeclarativeStrategy(Strategy):
 
     @classmethod
     def from_json(cls, path: str) -> "DeclarativeStrategy":
-        """Load from a JSON file."""
-        with open(path) as f:
-            return cls(json.load(f))
+        """Load from a JSON file.
+
+        Parsing is memoized on the file content, so repeated loads of an
+        unchanged file reuse the same parsed config. Treat it as
+        read-only.
+        """
+        with open(path, "rb") as f:
+            return cls(_parse_source(f.read()))
 
     @classmethod
     def from_dict(cls, config: dict) -> "DeclarativeStrategy":
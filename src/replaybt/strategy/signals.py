@@ -0,0 +1,49 @@
+"""Vectorized signal helpers for batch-mode strategies.
+
+Operate on whole indicator series (e.g. from
+IndicatorManager.batch_series() inside Strategy.prepare()) instead of
+tracking previous values bar by bar. NaN (warmup) compares False,
+matching the scalar ``None`` checks.
+"""
+
+from __future__ import annotations
+
+from typing import Union
+
+import numpy as np
+
+ArrayOrScalar = Union[np.ndarray, float]
+
+
+def _pair(a: ArrayOrScalar, b: ArrayOrScalar):
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    return np.broadcast_arrays(a, b)
+
+
+def crossover(a: ArrayOrScalar, b: ArrayOrScalar) -> np.ndarray:
+    """True where ``a`` crosses above ``b``.
+
+    ``out[i] = a[i] > b[i] and a[i-1] <= b[i-1]``; ``out[0]`` is False.
+    Either side may be a scalar (e.g. an RSI threshold).
+    """
+    a, b = _pair(a, b)
+    out = np.zeros(a.shape, dtype=np.bool_)
+    np.logical_and(a[1:] > b[1:], a[:-1] <= b[:-1], out=out[1:])
+    return out
+
+
+def crossunder(a: ArrayOrScalar, b: ArrayOrScalar) -> np.ndarray:
+    """True where ``a`` crosses below ``b`` (mirror of crossover())."""
+    a, b = _pair(a, b)
+    out = np.zeros(a.shape, dtype=np.bool_)
+    np.logical_and(a[1:] < b[1:], a[:-1] >= b[:-1], out=out[1:])
+    return out
+
+
+def events(mask: np.ndarray) -> np.ndarray:
+    """Bar indices where ``mask`` is True, in order."""
+    return np.flatnonzero(mask)
+
+
+__all__ = ["crossover", "crossunder", "events"]
@@ -47,6 +47,9 @@ class _DelayedStrategy(Strategy):
     def configure(self, config: dict) -> None:
         self._inner.configure(config)
 
+    def prepare(self, indicators) -> None:
+        self._inner.prepare(indicators)
+
     def on_bar(
         self,
         bar: Bar,
@@ -119,12 +122,18 @@ class DelayTest:
 
     def run(self) -> DelayTestResult:
         """Run normal + delayed backtests and compare."""
-        bars = list(self._data)
         symbol = self._data.symbol()
         tf = self._data.timeframe()
 
+        if hasattr(self._data, "as_arrays"):
+            # In-memory columnar provider: replay it directly (batch mode)
+            provider_a = provider_b = self._data
+        else:
+            bars = list(self._data)
+            provider_a = _ListProvider(bars, symbol, tf)
+            provider_b = _ListProvider(bars, symbol, tf)
+
         # Normal run
-        provider_a = _ListProvider(bars, symbol, tf)
         engine_a = BacktestEngine(
             strategy=self._factory(),
             data=provider_a,
@@ -133,7 +142,6 @@ class DelayTest:
         normal = engine_a.run()
 
         # Delayed run
-        provider_b = _ListProvider(bars, symbol, tf)
         delayed_strat = _DelayedStrategy(self._factory(), self._delay)
         engine_b = BacktestEngine(
             strategy=delayed_strat,
@@ -216,16 +224,23 @@ class OOSSplit:
 
     def run(self) -> OOSResult:
         """Run train + test backtests and compare."""
-        bars = list(self._data)
         symbol = self._data.symbol()
         tf = self._data.timeframe()
 
-        split_idx = int(len(bars) * self._split_ratio)
-        train_bars = bars[:split_idx]
-        test_bars = bars[split_idx:]
+        if hasattr(self._data, "slice"):
+            # Index windows over the provider's shared buffers
+            n = len(self._data)
+            split_idx = int(n * self._split_ratio)
+            provider_train = self._data.slice(0, split_idx)
+            provider_test = self._data.slice(split_idx, n)
+        else:
+            bars = list(self._data)
+            n = len(bars)
+            split_idx = int(n * self._split_ratio)
+            provider_train = _ListProvider(bars[:split_idx], symbol, tf)
+            provider_test = _ListProvider(bars[split_idx:], symbol, tf)
 
         # Train
-        provider_train = _ListProvider(train_bars, symbol, tf)
         engine_train = BacktestEngine(
             strategy=self._factory(),
             data=provider_train,
@@ -234,7 +249,6 @@ class OOSSplit:
         train_result = engine_train.run()
 
         # Test
-        provider_test = _ListProvider(test_bars, symbol, tf)
         engine_test = BacktestEngine(
             strategy=self._factory(),
             data=provider_test,
@@ -250,8 +264,9 @@ class OOSSplit:
             pnl_ratio = 0.0 if abs(test_result.net_pnl) < 1e-9 else float("inf")
         else:
             # Adjust for different period lengths
-            if len(test_bars) > 0 and len(train_bars) > 0:
-                length_factor = len(train_bars) / len(test_bars)
+            n_train, n_test = split_idx, n - split_idx
+            if n_test > 0 and n_train > 0:
+                length_factor = n_train / n_test
             else:
                 length_factor = 1.0
             pnl_ratio = (test_result.net_pnl * length_factor) / abs(
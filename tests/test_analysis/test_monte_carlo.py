@@ -125,3 +125,59 @@ class TestMonteCarlo:
         assert result.ruin_probability > 0.9, (
             f"Expected high ruin prob with all losses, got {result.ruin_probability}"
         )
+
+    def test_bootstrap_batches_match_single_pass(self, monkeypatch):
+        """Splitting bootstrap into memory-bounded batches keeps the draws."""
+        import replaybt.analysis.monte_carlo as mc_mod
+
+        pnls = np.array([100, -50, 200, -30, 150, 80, -40], dtype=np.float64)
+        whole = MonteCarlo._run_bootstrap(
+            pnls, 10_000.0, 300, np.random.default_rng(3)
+        )
+        # 7 trades -> 8 float64 cells per row; force ~64-row batches
+        monkeypatch.setattr(mc_mod, "_BOOTSTRAP_BATCH_BYTES", 64 * 64)
+        batched = MonteCarlo._run_bootstrap(
+            pnls, 10_000.0, 300, np.random.default_rng(3)
+        )
+
+        assert mc_mod._bootstrap_batch_size(len(pnls)) == 64
+        np.testing.assert_allclose(batched[0], whole[0])
+        np.testing.assert_allclose(batched[1], whole[1])
+
+    def test_bootstrap_final_pnl_is_path_sum(self):
+        """Each bootstrap final PnL is the sum of that path's sampled trades."""
+        pnls = np.array([100, -50, 200, -30, 150], dtype=np.float64)
+        final, _ = MonteCarlo._run_bootstrap(
+            pnls, 10_000.0, 50, np.random.default_rng(11)
+        )
+        idx = np.random.default_rng(11).integers(
+            0, len(pnls), size=(50, len(pnls)), dtype=np.int32
+        )
+        np.testing.assert_allclose(final, pnls[idx].sum(axis=1))
+
+
+class TestShuffleKernel:
+    def test_matches_reference_for_order_invariant_paths(self):
+        """Identical trades make every permutation the same equity path."""
+        from replaybt.analysis.monte_carlo import _max_dd_pct, _shuffle_kernel
+
+        pnls = np.full(6, -2_000.0)
+        seeds = np.arange(8, dtype=np.uint32)
+        dds, ruined = _shuffle_kernel(pnls, 10_000.0, 0.0, seeds)
+
+        curve = 10_000.0 + np.concatenate([[0.0], np.cumsum(pnls)])
+        expected = _max_dd_pct(curve[None, :])[0]
+        np.testing.assert_allclose(dds, expected)
+        assert ruined.all()
+
+    def test_paths_depend_only_on_their_seed(self):
+        """Each path is reproducible from its own seed, independent of order."""
+        from replaybt.analysis.monte_carlo import _shuffle_kernel
+
+        pnls = np.array([100, -50, 200, -300, 150, 80, -40], dtype=np.float64)
+        seeds = np.array([5, 9, 13, 21], dtype=np.uint32)
+        dds, ruined = _shuffle_kernel(pnls, 1_000.0, 900.0, seeds)
+        rev_dds, rev_ruined = _shuffle_kernel(pnls, 1_000.0, 900.0, seeds[::-1].copy())
+
+        np.testing.assert_allclose(dds, rev_dds[::-1])
+        np.testing.assert_array_equal(ruined, rev_ruined[::-1])
@@ -0,0 +1,73 @@
+"""Tests for columnar record buffers."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from replaybt.data.columns import (
+    FILL_DTYPE, TRADE_DTYPE, RecordBuffer, side_tag, to_epoch_ns,
+)
+from replaybt.data.types import Bar, Side
+from replaybt.engine.orders import MarketOrder
+from replaybt.engine.portfolio import Portfolio
+
+
+class TestRecordBuffer:
+    def test_grows_past_capacity(self):
+        buf = RecordBuffer(FILL_DTYPE, capacity=2)
+        for i in range(5):
+            buf.append((i, 1, 100.0 + i, 1000.0, 0.5, True))
+        assert len(buf) == 5
+        assert buf.column("price").tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+        assert buf.column("ts").dtype == np.int64
+
+    def test_clear(self):
+        buf = RecordBuffer(FILL_DTYPE)
+        buf.append((0, -1, 1.0, 1.0, 0.0, False))
+        buf.clear()
+        assert len(buf) == 0
+        assert len(buf.records) == 0
+
+
+class TestHelpers:
+    def test_epoch_ns_naive_is_utc(self):
+        assert to_epoch_ns(datetime(1970, 1, 1, 0, 0, 1)) == 1_000_000_000
+
+    def test_epoch_ns_aware(self):
+        dt = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+        assert to_epoch_ns(dt) == to_epoch_ns(datetime(2023, 12, 31, 22))
+
+    def test_side_tag(self):
+        assert side_tag(Side.LONG) == 1
+        assert side_tag(Side.SHORT) == -1
+
+    def test_side_enum_tag(self):
+        from replaybt.data.types import SIDE_LONG, SIDE_SHORT
+
+        assert Side.LONG.tag == SIDE_LONG == side_tag(Side.LONG)
+        assert Side.SHORT.tag == SIDE_SHORT == side_tag(Side.SHORT)
+        # str-valued sides still compare equal to the enum
+        assert side_tag("LONG") == SIDE_LONG
+
+
+class TestPortfolioColumns:
+    def test_mirror_trades_and_fills(self):
+        portfolio = Portfolio(initial_equity=10_000, default_size_usd=1_000)
+        t0 = datetime(2024, 1, 1)
+        entry = Bar(t0, 100, 101, 99, 100, 1000)
+        exit_bar = Bar(t0 + timedelta(minutes=5), 110, 111, 109, 110, 1000)
+
+        portfolio.open_position(entry, MarketOrder(side=Side.LONG))
+        trade = portfolio.close_position(0, 110.0, exit_bar, "SIGNAL")
+
+        cols = portfolio.trade_columns
+        assert cols.records.dtype == TRADE_DTYPE
+        assert len(cols) == 1
+        assert cols.column("pnl_usd")[0] == trade.pnl_usd
+        assert cols.column("side")[0] == 1
+        assert cols.column("exit_ts")[0] == to_epoch_ns(exit_bar.timestamp)
+        assert portfolio.fill_columns.column("is_entry").tolist() == [True, False]
+
+        portfolio.reset()
+        assert len(portfolio.trade_columns) == 0
+        assert len(portfolio.fill_columns) == 0
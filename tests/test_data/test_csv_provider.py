@@ -3,6 +3,9 @@
 import pytest
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from replaybt.data.providers.csv import CSVProvider
 from replaybt.data.types import Bar
 
@@ -74,3 +77,122 @@ class TestCSVProvider:
         bars2 = list(provider)
         assert len(bars1) == len(bars2)
         assert bars1[0].close == bars2[0].close
+
+
+class TestCSVProviderArrays:
+    def test_as_arrays_columns(self):
+        provider = CSVProvider(FIXTURE_PATH, symbol_name="TEST")
+        arrays = provider.as_arrays()
+        assert set(arrays) == {"timestamp", "open", "high", "low", "close", "volume"}
+        assert arrays["timestamp"].dtype == np.int64
+        for col in ("open", "high", "low", "close", "volume"):
+            assert arrays[col].dtype == np.float64
+            assert arrays[col].flags["C_CONTIGUOUS"]
+            assert len(arrays[col]) == 20
+
+    def test_as_arrays_match_bars(self):
+        provider = CSVProvider(
+            FIXTURE_PATH, symbol_name="TEST",
+            start="2024-01-01 00:05:00", end="2024-01-01 00:10:00",
+        )
+        arrays = provider.as_arrays()
+        bars = list(provider)
+        assert len(arrays["close"]) == len(bars) == 6
+        for i, bar in enumerate(bars):
+            assert arrays["close"][i] == bar.close
+            assert arrays["timestamp"][i] == int(pd.Timestamp(bar.timestamp).value)
+
+    def test_bar_fields_are_python_floats(self):
+        bar = next(iter(CSVProvider(FIXTURE_PATH, symbol_name="TEST")))
+        assert type(bar.close) is float
+        assert type(bar.volume) is float
+
+    def test_reiterable(self):
+        provider = CSVProvider(FIXTURE_PATH, symbol_name="TEST")
+        first = list(provider)
+        provider.reset()
+        assert list(provider) == first
+
+
+class TestCSVProviderCache:
+    def test_instances_share_parse(self):
+        from replaybt.data.providers import csv as csv_mod
+
+        csv_mod.clear_cache()
+        a = CSVProvider(FIXTURE_PATH, symbol_name="A")
+        b = CSVProvider(FIXTURE_PATH, symbol_name="B")
+        assert a._load() is b._load()
+        assert len(csv_mod._CACHE) == 1
+        assert next(iter(b)).symbol == "B"
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        import os
+
+        path = tmp_path / "X_1m.csv"
+        path.write_text(FIXTURE_PATH.read_text())
+        assert len(CSVProvider(path)) == 20
+
+        lines = FIXTURE_PATH.read_text().splitlines()[:11]
+        path.write_text("\n".join(lines) + "\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert len(CSVProvider(path)) == 10
+
+    def test_slice_shares_buffers(self):
+        provider = CSVProvider(FIXTURE_PATH, symbol_name="TEST")
+        bars = list(provider)
+        part = provider.slice(5, 12)
+        assert len(part) == 7
+        assert list(part) == bars[5:12]
+        assert np.shares_memory(part.as_arrays()["close"], provider.as_arrays()["close"])
+
+    def test_nested_slice_matches_bars(self):
+        provider = CSVProvider(FIXTURE_PATH, symbol_name="TEST")
+        bars = list(provider)
+        part = provider.slice(2, 15).slice(3, 8)
+        assert list(part) == bars[5:10]
+        assert part.to_dataframe()["close"].tolist() == [b.close for b in bars[5:10]]
+
+
+class TestCSVProviderSidecar:
+    def _copy(self, tmp_path):
+        path = tmp_path / "X_1m.csv"
+        path.write_text(FIXTURE_PATH.read_text())
+        return path
+
+    def test_sidecar_matches_parsed(self, tmp_path):
+        path = self._copy(tmp_path)
+        want = list(CSVProvider(path, "X"))
+        provider = CSVProvider(path, "X", mmap_cache=True)
+        assert list(provider) == want
+        assert len(list(tmp_path.glob("X_1m.csv.*.npy"))) == 1
+
+        # Second provider maps the existing sidecar without parsing
+        again = CSVProvider(path, "X", mmap_cache=True)
+        arrays = again.as_arrays()
+        assert not arrays["close"].flags["WRITEABLE"]
+        assert again._df is None
+        assert list(again) == want
+        assert len(again) == 20
+
+    def test_sidecar_date_filter_and_slice(self, tmp_path):
+        path = self._copy(tmp_path)
+        kwargs = dict(start="2024-01-01 00:05:00", end="2024-01-01 00:10:00")
+        want = list(CSVProvider(path, "X", **kwargs))
+        provider = CSVProvider(path, "X", mmap_cache=True, **kwargs)
+        assert list(provider) == want
+        assert list(provider.slice(1, 4)) == want[1:4]
+        assert provider.slice(1, 4).to_dataframe()["close"].tolist() == [
+            b.close for b in want[1:4]
+        ]
+
+    def test_modified_file_gets_new_sidecar(self, tmp_path):
+        import os
+
+        path = self._copy(tmp_path)
+        assert len(CSVProvider(path, mmap_cache=True)) == 20
+        lines = FIXTURE_PATH.read_text().splitlines()[:11]
+        path.write_text("\n".join(lines) + "\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert len(CSVProvider(path, mmap_cache=True)) == 10
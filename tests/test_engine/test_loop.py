@@ -482,3 +482,65 @@ class TestOnBarReturnsList:
         results = engine.run()
         assert results.total_trades == 0
         assert results.final_equity == 10000
+
+
+class RecordIndicatorsStrategy(Strategy):
+    """Records the indicator dict seen on every bar."""
+
+    def configure(self, config):
+        self.seen = []
+
+    def on_bar(self, bar, indicators, positions):
+        self.seen.append(dict(indicators))
+        return None
+
+
+class TestPrecomputedIndicators:
+    INDICATORS = {
+        "ema": {"type": "ema", "period": 5},
+        "sma": {"type": "sma", "period": 4},
+        "rsi": {"type": "rsi", "period": 5, "mode": "wilder"},
+        "atr": {"type": "atr", "period": 5},
+        "bb": {"type": "bollinger", "period": 5},
+        "macd": {"type": "macd", "fast_period": 3, "slow_period": 6, "signal_period": 3},
+        "stoch": {"type": "stochastic", "k_period": 5},
+        "vwap": {"type": "vwap"},
+        "obv": {"type": "obv"},
+        "chop": {"type": "chop", "period": 5},
+        "ema_5m": {"type": "ema", "timeframe": "5m", "period": 2},
+    }
+
+    def test_csv_run_matches_incremental(self, tmp_path):
+        """CSV-backed runs serve precomputed values identical to the bar-by-bar path."""
+        from replaybt.data.providers.csv import CSVProvider
+
+        bars = make_bars(60, trend=0.0)
+        for i, b in enumerate(bars):
+            # Add some movement so RSI/ATR are non-trivial
+            bars[i] = Bar(
+                timestamp=b.timestamp, open=b.open, high=b.high + (i % 7) * 0.1,
+                low=b.low - (i % 5) * 0.1, close=b.close + ((i * 37) % 11 - 5) * 0.2,
+                volume=b.volume, symbol="TEST", timeframe="1m",
+            )
+        path = tmp_path / "TEST_1m.csv"
+        with open(path, "w") as f:
+            f.write("timestamp,open,high,low,close,volume\n")
+            for b in bars:
+                f.write(f"{b.timestamp},{b.open!r},{b.high!r},{b.low!r},{b.close!r},{b.volume!r}\n")
+
+        config = {"indicators": self.INDICATORS}
+        incremental = RecordIndicatorsStrategy()
+        BacktestEngine(incremental, ListProvider(bars), config).run()
+        batch = RecordIndicatorsStrategy()
+        engine = BacktestEngine(batch, CSVProvider(path, "TEST"), config)
+        engine.run()
+
+        assert set(engine.indicators._precomputed) == set(self.INDICATORS) - {"ema_5m"}
+        assert len(batch.seen) == len(incremental.seen) == 60
+        for got, want in zip(batch.seen, incremental.seen):
+            assert got.keys() == want.keys()
+            for name, val in want.items():
+                if val is None:
+                    assert got[name] is None
+                else:
+                    assert got[name] == pytest.approx(val, rel=1e-9)
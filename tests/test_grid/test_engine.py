@@ -185,6 +185,27 @@ class TestVolGuard:
         assert results.vol_guard_bars_paused > 0
 
 
+    def test_atr_pct_kernel_matches_window_mean(self):
+        import numpy as np
+        from replaybt.grid.engine import _vol_guard_atr_pct
+
+        bars = _spike_bars(30, mid=100.0, spike_at=10, spike_size=3.0)
+        high = np.array([b.high for b in bars])
+        low = np.array([b.low for b in bars])
+        close = np.array([b.close for b in bars])
+        tr, atr_pct = _vol_guard_atr_pct(high, low, close, 4)
+
+        trs = [0.0] + [
+            max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+            for i in range(1, len(bars))
+        ]
+        assert tr.tolist() == pytest.approx(trs)
+        assert np.isnan(atr_pct[:4]).all()
+        for i in range(4, len(bars)):
+            want = sum(trs[i - 3:i + 1]) / 4 / close[i] * 100
+            assert atr_pct[i] == pytest.approx(want, rel=1e-12)
+
+
 class TestCircuitBreaker:
     def test_drawdown_pauses_grid(self):
         """Large drawdown triggers circuit breaker -> fewer fills than without."""
@@ -234,6 +234,52 @@ class TestCancel:
             assert mgr.orders[oid].is_pingpong is True
 
 
+    def test_cancel_order(self):
+        mgr = GridManager(spread_pct=0.001, slippage_pct=0.0)
+        mgr.place_grid([GridLevel(price=99.0, size=0.1, side="bid")])
+        oid = next(iter(mgr._open_ids))
+
+        mgr.cancel_order(oid)
+        assert mgr.orders[oid].status == OrderStatus.CANCELLED
+        # Cancelled order no longer matches
+        assert mgr.check_fills(
+            candle_low=90.0, candle_high=100.0, candle_open=95.0, bar_index=1
+        ) == []
+
+
+class TestBookSnapshot:
+    def test_quiet_bar_no_fills(self):
+        mgr = GridManager(spread_pct=0.001, slippage_pct=0.0)
+        mgr.place_grid(_make_levels(100.0, 0.01, n=3))
+        fills = mgr.check_fills(
+            candle_low=99.5, candle_high=100.5, candle_open=100.0, bar_index=1
+        )
+        assert fills == []
+        assert len(mgr._open_ids) == 6
+
+    def test_snapshot_refreshed_after_place(self):
+        mgr = GridManager(spread_pct=0.001, slippage_pct=0.0)
+        mgr.place_grid([GridLevel(price=95.0, size=0.1, side="bid")])
+        assert mgr.check_fills(
+            candle_low=99.0, candle_high=101.0, candle_open=100.0, bar_index=1
+        ) == []
+
+        mgr.place_grid([GridLevel(price=99.5, size=0.1, side="bid")], bar_index=2)
+        fills = mgr.check_fills(
+            candle_low=99.0, candle_high=101.0, candle_open=100.0, bar_index=3
+        )
+        assert [f.price for f in fills] == [99.5]
+
+    def test_match_bar_kernel(self):
+        import numpy as np
+        from replaybt.grid.manager import _match_bar
+
+        prices = np.array([99.0, 101.0, 98.0, 102.0])
+        is_bid = np.array([True, False, True, False])
+        assert _match_bar(prices, is_bid, 98.5, 101.5).tolist() == [0, 1]
+        assert _match_bar(prices, is_bid, 99.5, 100.5).tolist() == []
+
+
 class TestOpenIdsTracking:
     def test_ids_stay_in_sync(self):
         mgr = GridManager(spread_pct=0.001, slippage_pct=0.0)
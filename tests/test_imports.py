@@ -0,0 +1,27 @@
+"""Tests for the lazy top-level import surface."""
+
+import subprocess
+import sys
+
+import pytest
+
+import replaybt
+
+
+class TestLazyExports:
+    @pytest.mark.parametrize("name", replaybt.__all__)
+    def test_public_name_resolves(self, name):
+        assert getattr(replaybt, name) is not None
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(AttributeError):
+            replaybt.NotAThing
+
+    def test_core_import_skips_pandas(self):
+        code = (
+            "import sys\n"
+            "from replaybt import BacktestEngine, Strategy, Bar, MarketOrder, Side\n"
+            "assert 'pandas' not in sys.modules\n"
+            "assert 'replaybt.data.providers.live' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
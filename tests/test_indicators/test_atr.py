@@ -93,3 +93,24 @@ class TestATR:
             atr.update(b)
         assert atr.ready is True
         assert atr.value() > 0
+
+
+class TestATRPrecompute:
+    @pytest.mark.parametrize("mode", ["sma", "wilder"])
+    def test_matches_incremental(self, mode):
+        """precompute() reproduces update() bar by bar in both modes."""
+        np.random.seed(3)
+        bars = make_ohlc_bars(200)
+        arrays = {
+            col: np.array([getattr(b, col) for b in bars], dtype=np.float64)
+            for col in ("open", "high", "low", "close", "volume")
+        }
+        atr = ATR("test", period=14, mode=mode)
+        series = atr.precompute(arrays)
+
+        for i, b in enumerate(bars):
+            atr.update(b)
+            if atr.value() is None:
+                assert np.isnan(series[i])
+            else:
+                assert series[i] == pytest.approx(atr.value(), rel=1e-12)
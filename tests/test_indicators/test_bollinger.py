@@ -82,3 +82,35 @@ class TestBollingerBands:
         val = bb.value()
         assert val["bandwidth"] == pytest.approx(0.0, abs=0.001)
         assert val["upper"] == val["lower"] == val["middle"]
+
+
+class TestBollingerPrecompute:
+    def test_matches_incremental(self):
+        np.random.seed(5)
+        prices = list(100 + np.cumsum(np.random.randn(200)))
+        bb = BollingerBands("test", period=20, num_std=2.0)
+        series = bb.precompute({"close": np.array(prices)})
+
+        for i, b in enumerate(make_bars(prices)):
+            bb.update(b)
+            if bb.value() is None:
+                assert np.isnan(series["middle"][i])
+                continue
+            for key, val in bb.value().items():
+                assert series[key][i] == pytest.approx(val, rel=1e-9, abs=1e-9)
+
+
+class TestBollingerOnline:
+    def test_long_run_matches_two_pass(self):
+        """Sliding Welford updates stay on the exact two-pass values."""
+        np.random.seed(9)
+        prices = list(1000 + np.cumsum(np.random.randn(3000) * 5))
+        bb = BollingerBands("test", period=20)
+        for i, b in enumerate(make_bars(prices)):
+            bb.update(b)
+            if i >= 19:
+                window = np.array(prices[i - 19:i + 1])
+                assert bb.middle == pytest.approx(window.mean(), rel=1e-12)
+                assert bb.upper - bb.middle == pytest.approx(
+                    2.0 * window.std(), rel=1e-7, abs=1e-9,
+                )
@@ -72,3 +72,23 @@ class TestCHOP:
             chop_high.update(b)
 
         assert chop_high.value() > chop_low.value()
+
+
+class TestCHOPPrecompute:
+    @pytest.mark.parametrize("atr_mode", ["sma", "wilder"])
+    def test_matches_incremental(self, atr_mode):
+        np.random.seed(5)
+        bars = make_ohlc_bars(150)
+        arrays = {
+            col: np.array([getattr(b, col) for b in bars])
+            for col in ("open", "high", "low", "close", "volume")
+        }
+        chop = CHOP("test", period=14, atr_mode=atr_mode)
+        series = chop.precompute(arrays)
+
+        for i, b in enumerate(bars):
+            chop.update(b)
+            if chop.value() is None:
+                assert np.isnan(series[i])
+            else:
+                assert series[i] == pytest.approx(chop.value(), rel=1e-12)
@@ -183,3 +183,60 @@ class TestIndicatorManagerBuiltins:
         # At least EMA and OBV should be ready after 30 bars
         assert values["my_ema"] is not None
         assert values["my_obv"] is not None
+
+
+class TestIndicatorManagerBatchValues:
+    CONFIG = {
+        "ema": {"type": "ema", "period": 3},
+        "bb": {"type": "bollinger", "period": 4},
+        "hh": {"type": "highest_high", "period": 3},
+    }
+
+    def test_values_match_incremental(self):
+        """values() in batch mode mixes served, dict-valued and live indicators."""
+        import numpy as np
+
+        IndicatorManager.register("highest_high", HighestHigh)
+        bars = make_bars(12)
+        arrays = {
+            f: np.array([getattr(b, f) for b in bars], dtype=np.float64)
+            for f in ("open", "high", "low", "close", "volume")
+        }
+        live = IndicatorManager(self.CONFIG)
+        batch = IndicatorManager(self.CONFIG)
+        batch.precompute(arrays)
+
+        assert batch.values() == {"ema": None, "bb": None, "hh": None}
+        for b in bars:
+            live.update(b)
+            batch.update(b)
+            want, got = live.values(), batch.values()
+            assert got.keys() == want.keys()
+            assert got["hh"] == want["hh"]
+            if want["ema"] is None:
+                assert got["ema"] is None
+            else:
+                assert got["ema"] == pytest.approx(want["ema"])
+            if want["bb"] is None:
+                assert got["bb"] is None
+            else:
+                assert got["bb"] == pytest.approx(want["bb"])
+
+    def test_slots_match_names(self):
+        import numpy as np
+
+        IndicatorManager.register("highest_high", HighestHigh)
+        bars = make_bars(8)
+        arrays = {
+            f: np.array([getattr(b, f) for b in bars], dtype=np.float64)
+            for f in ("open", "high", "low", "close", "volume")
+        }
+        mgr = IndicatorManager(self.CONFIG)
+        mgr.precompute(arrays)
+        slots = {name: mgr.slot_of(name) for name in self.CONFIG}
+        assert sorted(slots.values()) == [0, 1, 2]
+        assert mgr.slot_of("missing") is None
+        for b in bars:
+            mgr.update(b)
+            for name, slot in slots.items():
+                assert mgr.value_at(slot) == mgr.get(name)
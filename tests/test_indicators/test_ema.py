@@ -98,3 +98,18 @@ class TestEMABatchVsIncremental:
         for b in bars:
             ema.update(b)
         assert ema.value() == pytest.approx(v1, abs=0.0001)
+
+
+class TestEMAPrecompute:
+    def test_matches_incremental(self):
+        """precompute() reproduces the incremental value after every bar."""
+        np.random.seed(7)
+        prices = list(100 + np.cumsum(np.random.randn(300)))
+        bars = make_close_bars(prices)
+        ema = EMA("test", period=10)
+        arrays = {"close": np.array(prices, dtype=np.float64)}
+        series = ema.precompute(arrays)
+
+        for i, b in enumerate(bars):
+            ema.update(b)
+            assert series[i] == ema.value()
@@ -69,3 +69,19 @@ class TestMACD:
         assert "macd" in val
         assert "signal" in val
         assert "histogram" in val
+
+
+class TestMACDPrecompute:
+    def test_matches_incremental(self):
+        np.random.seed(5)
+        prices = list(100 + np.cumsum(np.random.randn(200)))
+        macd = MACD("test", fast_period=12, slow_period=26, signal_period=9)
+        series = macd.precompute({"close": np.array(prices)})
+
+        for i, b in enumerate(make_bars(prices)):
+            macd.update(b)
+            if macd.value() is None:
+                assert np.isnan(series["macd"][i])
+                continue
+            for key, val in macd.value().items():
+                assert series[key][i] == pytest.approx(val, rel=1e-12, abs=1e-12)
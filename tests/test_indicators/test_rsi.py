@@ -142,3 +142,32 @@ class TestRSIModes:
         # Both should be ready and produce different values
         assert rsi_w.ready and rsi_s.ready
         assert rsi_w.value() != rsi_s.value()
+
+
+class TestRSIPrecompute:
+    @pytest.mark.parametrize("mode", ["wilder", "simple"])
+    def test_matches_incremental(self, mode):
+        """precompute() reproduces update() bar by bar in both modes."""
+        np.random.seed(11)
+        prices = list(100 + np.cumsum(np.random.randn(300)))
+        rsi = RSI("test", period=7, mode=mode)
+        series = rsi.precompute({"close": np.array(prices, dtype=np.float64)})
+
+        for i, b in enumerate(make_close_bars(prices)):
+            rsi.update(b)
+            if rsi.value() is None:
+                assert np.isnan(series[i])
+            else:
+                assert series[i] == pytest.approx(rsi.value(), rel=1e-12)
+
+
+class TestRSISimpleOnline:
+    def test_all_gain_window_is_exactly_100(self):
+        """Running sums don't leave rounding residue in an all-gain window."""
+        prices = [100.0, 99.3, 101.7, 98.1] + [98.1 + 0.1 * i for i in range(1, 20)]
+        rsi = RSI("test", period=7, mode="simple")
+        for b in make_close_bars(prices):
+            rsi.update(b)
+        assert rsi.value() == 100.0
+        series = rsi.precompute({"close": np.array(prices)})
+        assert series[-1] == 100.0
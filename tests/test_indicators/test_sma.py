@@ -56,3 +56,19 @@ class TestSMA:
 
         for i in range(period, len(prices)):
             assert inc_values[i] == pytest.approx(batch.iloc[i], abs=0.0001)
+
+
+class TestSMAPrecompute:
+    def test_matches_incremental(self):
+        """precompute() is NaN during warmup, then matches update()."""
+        np.random.seed(7)
+        prices = list(100 + np.cumsum(np.random.randn(200)))
+        sma = SMA("test", period=20)
+        series = sma.precompute({"close": np.array(prices, dtype=np.float64)})
+
+        for i, b in enumerate(make_bars(prices)):
+            sma.update(b)
+            if sma.value() is None:
+                assert np.isnan(series[i])
+            else:
+                assert series[i] == pytest.approx(sma.value(), rel=1e-12)
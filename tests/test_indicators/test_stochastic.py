@@ -71,3 +71,39 @@ class TestStochastic:
         val = stoch.value()
         assert "k" in val
         assert "d" in val
+
+
+class TestStochasticPrecompute:
+    @pytest.mark.parametrize("smooth_k,d_period", [(3, 3), (1, 3), (1, 1)])
+    def test_matches_incremental(self, smooth_k, d_period):
+        np.random.seed(5)
+        bars = make_ohlc_bars(150)
+        arrays = {
+            col: np.array([getattr(b, col) for b in bars])
+            for col in ("open", "high", "low", "close", "volume")
+        }
+        stoch = Stochastic("test", k_period=14, d_period=d_period, smooth_k=smooth_k)
+        series = stoch.precompute(arrays)
+
+        for i, b in enumerate(bars):
+            stoch.update(b)
+            if stoch.value() is None:
+                assert np.isnan(series["k"][i])
+                continue
+            assert series["k"][i] == pytest.approx(stoch.k, rel=1e-12)
+            assert series["d"][i] == pytest.approx(stoch.d, rel=1e-12)
+
+
+class TestStochasticOnline:
+    def test_window_extremes_match_brute_force(self):
+        np.random.seed(9)
+        bars = make_ohlc_bars(500)
+        stoch = Stochastic("test", k_period=14, d_period=1, smooth_k=1)
+        for i, b in enumerate(bars):
+            stoch.update(b)
+            if i >= 13:
+                window = bars[i - 13:i + 1]
+                hh = max(x.high for x in window)
+                ll = min(x.low for x in window)
+                expected = 50.0 if hh == ll else (b.close - ll) / (hh - ll) * 100
+                assert stoch.k == pytest.approx(expected, rel=1e-12)
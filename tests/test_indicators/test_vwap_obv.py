@@ -66,3 +66,49 @@ class TestOBV:
         obv.update(Bar(datetime(2024, 1, 1, 0, 2), 101, 103, 100, 102, 300))  # +300
         obv.update(Bar(datetime(2024, 1, 1, 0, 3), 102, 103, 100, 99, 200))   # -200
         assert obv.value() == 600  # 500 + 300 - 200
+
+
+class TestVWAPOBVPrecompute:
+    def _bars_and_arrays(self):
+        import numpy as np
+        from replaybt.data.columns import to_epoch_ns
+
+        rng = np.random.default_rng(5)
+        bars = []
+        for i in range(400):
+            c = 100 + float(rng.normal())
+            vol = 0.0 if i % 50 == 0 else float(rng.integers(1, 1000))
+            bars.append(Bar(
+                datetime(2024, 1, 1) + timedelta(minutes=11 * i),
+                c, c + 1, c - 1, c, vol,
+            ))
+        arrays = {
+            col: np.array([getattr(b, col) for b in bars])
+            for col in ("open", "high", "low", "close", "volume")
+        }
+        arrays["timestamp"] = np.array([to_epoch_ns(b.timestamp) for b in bars])
+        return bars, arrays
+
+    def test_vwap_matches_incremental(self):
+        bars, arrays = self._bars_and_arrays()
+        vwap = VWAP("test")
+        series = vwap.precompute(arrays)
+        for i, b in enumerate(bars):
+            vwap.update(b)
+            if vwap.value() is None:
+                assert series[i] != series[i]
+            else:
+                assert series[i] == vwap.value()
+
+    def test_vwap_needs_timestamps(self):
+        _, arrays = self._bars_and_arrays()
+        del arrays["timestamp"]
+        assert VWAP("test").precompute(arrays) is None
+
+    def test_obv_matches_incremental(self):
+        bars, arrays = self._bars_and_arrays()
+        obv = OBV("test")
+        series = obv.precompute(arrays)
+        for i, b in enumerate(bars):
+            obv.update(b)
+            assert series[i] == obv.value()
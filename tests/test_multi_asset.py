@@ -358,6 +358,75 @@ class TestExposureCap:
         assert len(symbols_with_trades) <= 2
 
 
+    def test_exposure_vector_tracks_positions(self):
+        """Per-symbol exposure slots mirror open position sizes."""
+        class BuyOnBarTwo(Strategy):
+            def configure(self, config):
+                self._bar_count = {}
+
+            def on_bar(self, bar, indicators, positions):
+                sym = bar.symbol
+                self._bar_count[sym] = self._bar_count.get(sym, 0) + 1
+                if self._bar_count[sym] == 2 and not positions:
+                    return MarketOrder(
+                        side=Side.LONG, take_profit_pct=0.50, stop_loss_pct=0.50,
+                    )
+                return None
+
+        engine = MultiAssetEngine(
+            strategy=BuyOnBarTwo(),
+            assets={
+                "AAA": ListProvider(make_bars(10, symbol="AAA"), sym="AAA"),
+                "BBB": ListProvider(make_bars(10, symbol="BBB"), sym="BBB"),
+            },
+            config={"default_size_usd": 5_000, "max_total_exposure_usd": 50_000},
+        )
+        engine.run()
+        assert list(engine._exposure) == [5_000.0, 5_000.0]
+
+
+class TestMultiAssetPrecompute:
+    """In-memory providers get batch indicator series per symbol."""
+
+    def test_csv_assets_match_list_assets(self, tmp_path):
+        from replaybt.data.providers.csv import CSVProvider
+
+        indicators = {"ema": {"type": "ema", "period": 5}}
+        assets_list, assets_csv = {}, {}
+        for sym, base in (("AAA", 100.0), ("BBB", 50.0)):
+            bars = make_bars(40, base_price=base, trend=0.3, symbol=sym)
+            path = tmp_path / f"{sym}_1m.csv"
+            with open(path, "w") as f:
+                f.write("timestamp,open,high,low,close,volume\n")
+                for b in bars:
+                    f.write(f"{b.timestamp},{b.open!r},{b.high!r},{b.low!r},{b.close!r},{b.volume!r}\n")
+            assets_list[sym] = ListProvider(bars, sym=sym)
+            assets_csv[sym] = CSVProvider(path, sym)
+
+        def collect(assets):
+            seen = []
+
+            class Logger(Strategy):
+                def on_bar(self, bar, indicators, positions):
+                    seen.append((bar.symbol, indicators.get("ema")))
+                    return None
+
+            engine = MultiAssetEngine(Logger(), assets, {"indicators": indicators})
+            engine.run()
+            return engine, seen
+
+        _, want = collect(assets_list)
+        engine, got = collect(assets_csv)
+        assert all("ema" in engine._indicators[s]._precomputed for s in ("AAA", "BBB"))
+        assert len(got) == len(want) == 80
+        for (gs, gv), (ws, wv) in zip(got, want):
+            assert gs == ws
+            if wv is None:
+                assert gv is None
+            else:
+                assert gv == pytest.approx(wv, rel=1e-12)
+
+
 class TestPerSymbolConfig:
     """Per-symbol indicator configs work correctly."""
 
@@ -1,6 +1,6 @@
 """Tests for ParameterSweep and SweepResults."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List
 
 import pytest
@@ -154,6 +154,88 @@ class TestParameterSweep:
         tp_values = {c["take_profit_pct"] for c in results.combos}
         assert tp_values == {0.02, 0.10}
 
+    def test_multi_worker_matches_single(self):
+        bars = make_bars(30)
+        kwargs = dict(
+            strategy_class=SweepableStrategy,
+            base_config={"initial_equity": 10000},
+            param_grid={
+                "take_profit_pct": [0.01, 0.04],
+                "stop_loss_pct": [0.005, 0.02],
+            },
+        )
+        single = ParameterSweep(data=ListProvider(bars), n_workers=1, **kwargs).run()
+        multi = ParameterSweep(data=ListProvider(bars), n_workers=2, **kwargs).run()
+        assert multi.combos == single.combos
+
+
+    def test_streaming_preserves_grid_order(self):
+        # More combos than 2 * n_workers, so submission is throttled
+        bars = make_bars(30)
+        kwargs = dict(
+            strategy_class=SweepableStrategy,
+            base_config={"initial_equity": 10000},
+            param_grid={
+                "take_profit_pct": [0.01, 0.02, 0.04],
+                "stop_loss_pct": [0.005, 0.01, 0.02],
+            },
+        )
+        sweep = ParameterSweep(data=ListProvider(bars), n_workers=2, **kwargs)
+        results = sweep.run()
+        keys = [(c["stop_loss_pct"], c["take_profit_pct"]) for c in results.combos]
+        expected = [(c["stop_loss_pct"], c["take_profit_pct"]) for c in sweep._build_combos()]
+        assert keys == expected
+        single = ParameterSweep(data=ListProvider(bars), n_workers=1, **kwargs).run()
+        assert results.combos == single.combos
+
+    def test_iter_combos_is_lazy(self):
+        sweep = ParameterSweep(
+            strategy_class=SweepableStrategy,
+            data=ListProvider(make_bars(5)),
+            base_config={},
+            param_grid={"a": [1, 2], "b": [3, 4, 5]},
+        )
+        it = sweep._iter_combos()
+        assert next(it) == {"a": 1, "b": 3}
+        assert sweep._n_combos() == 6
+        assert len(sweep._build_combos()) == 6
+
+
+class TestSharedBars:
+    def test_roundtrip(self):
+        from replaybt.optimize.sweep import _bars_from_arrays, _bars_to_shm, _shm_views
+
+        bars = make_bars(10)
+        shm = _bars_to_shm(bars)
+        try:
+            ts, prices = _shm_views(shm, len(bars))
+            rebuilt = _bars_from_arrays(ts, prices, None, "TEST", "1m")
+            del ts, prices
+        finally:
+            shm.close()
+            shm.unlink()
+        assert rebuilt == bars
+
+    def test_roundtrip_tz_aware(self):
+        from replaybt.optimize.sweep import _bars_from_arrays, _bars_to_shm, _shm_views
+
+        tz = timezone(timedelta(hours=-5))
+        bars = [
+            Bar(datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=tz) + timedelta(minutes=i),
+                1.0, 2.0, 0.5, 1.5, 10.0, "X", "5m")
+            for i in range(3)
+        ]
+        shm = _bars_to_shm(bars)
+        try:
+            ts, prices = _shm_views(shm, len(bars))
+            rebuilt = _bars_from_arrays(ts, prices, tz, "X", "5m")
+            del ts, prices
+        finally:
+            shm.close()
+            shm.unlink()
+        assert rebuilt == bars
+        assert rebuilt[0].timestamp.utcoffset() == timedelta(hours=-5)
+
 
 class TestSweepResults:
     @pytest.fixture
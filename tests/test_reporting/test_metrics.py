@@ -0,0 +1,26 @@
+"""Tests for BacktestResults trade statistics."""
+
+import numpy as np
+import pytest
+
+from replaybt.reporting.metrics import _trade_stats
+
+
+class TestTradeStats:
+    def test_matches_masked_sums(self):
+        rng = np.random.default_rng(7)
+        pnl_usd = rng.normal(0, 50, 200)
+        pnl_usd[::17] = 0.0  # breakeven trades count as losses
+        pnl_pct = pnl_usd / 1000
+
+        n_win, gp, gl, wps, lps = _trade_stats(pnl_usd, pnl_pct)
+        win = pnl_usd > 0
+        assert n_win == int(win.sum())
+        assert gp == pytest.approx(pnl_usd[win].sum())
+        assert gl == pytest.approx(abs(pnl_usd[~win].sum()))
+        assert wps == pytest.approx(pnl_pct[win].sum())
+        assert lps == pytest.approx(abs(pnl_pct[~win].sum()))
+
+    def test_empty(self):
+        empty = np.empty(0)
+        assert _trade_stats(empty, empty) == (0, 0.0, 0.0, 0.0, 0.0)
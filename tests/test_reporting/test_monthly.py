@@ -97,6 +97,29 @@ class TestMonthlyBreakdown:
         assert months[0].wins == 0
 
 
+    def test_columns_match_trade_list(self):
+        import numpy as np
+        from replaybt.data.columns import to_epoch_ns
+        from replaybt.reporting.monthly import monthly_breakdown_columns
+
+        trades = [
+            make_trade(m, pnl, exit_year=y)
+            for y, m, pnl in [
+                (2023, 12, 40), (2024, 1, -25), (2024, 1, 90),
+                (2024, 1, 0), (2024, 5, -10), (2023, 12, -70),
+            ]
+        ]
+        from_cols = monthly_breakdown_columns(
+            np.array([to_epoch_ns(t.exit_time) for t in trades]),
+            np.array([t.pnl_usd for t in trades], dtype=float),
+            np.array([t.fees for t in trades]),
+        )
+        assert from_cols == monthly_breakdown(trades)
+        assert [m.label for m in from_cols] == ["2023-12", "2024-01", "2024-05"]
+        assert from_cols[1].max_loss == -25
+        assert from_cols[1].losses == 2  # breakeven counts as a loss
+
+
 class TestFormatMonthlyTable:
     def test_empty_returns_message(self):
         result = format_monthly_table([])
@@ -450,6 +450,35 @@ class TestDeclarativeStrategy:
         finally:
             os.unlink(path)
 
+    def test_from_json_reuses_parse(self):
+        """Unchanged file content is parsed once and conditions are shared."""
+        config = _make_config()
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False,
+        ) as f:
+            json.dump(config, f)
+            path = f.name
+
+        try:
+            a = DeclarativeStrategy.from_json(path)
+            b = DeclarativeStrategy.from_json(path)
+            assert a is not b
+            assert a._config is b._config
+            assert a._long_conds[0] is b._long_conds[0]
+        finally:
+            os.unlink(path)
+
+    def test_from_dict_non_json_values(self):
+        """Configs with non-JSON values still parse (without memoization)."""
+        import numpy as np
+
+        config = _make_config()
+        config["entry"]["long"]["conditions"] = [
+            {"type": "above_threshold", "indicator": "x", "value": np.int64(3)},
+        ]
+        strat = DeclarativeStrategy.from_dict(config)
+        assert strat._long_conds[0].value == 3
+
     def test_null_indicator_safe(self):
         """None values don't trigger signals."""
         strat = DeclarativeStrategy(_make_config())
@@ -536,3 +565,117 @@ class TestDeclarativeStrategy:
         strat.on_bar(_bar(), curr, [])
 
         assert strat._prev_values == curr
+
+
+# ── Batch compilation ────────────────────────────────────────────────────
+
+
+class TestBatchSignals:
+    CONDITION_SETS = [
+        [{"type": "crossover", "fast": "a", "slow": "b"}],
+        [{"type": "crossunder", "fast": "a", "slow": "b"}],
+        [{"type": "above", "left": "a", "right": "bar.close"}],
+        [{"type": "below", "left": "a", "right": "b"},
+         {"type": "below_threshold", "indicator": "c", "value": 0.2}],
+        [{"type": "crosses_above", "indicator": "c", "value": 0.5}],
+        [{"type": "crosses_below", "indicator": "c", "value": 0.5},
+         {"type": "above_threshold", "indicator": "a", "value": 0.0}],
+        [],
+    ]
+
+    @pytest.mark.parametrize("raw", CONDITION_SETS)
+    def test_matches_evaluate_all(self, raw):
+        import numpy as np
+        from replaybt.strategy.declarative import compute_signal
+
+        rng = np.random.default_rng(1)
+        n = 200
+        series = {
+            "a": rng.normal(size=n),
+            "b": rng.normal(size=n),
+            "c": rng.random(n),
+            "bar.close": rng.normal(size=n),
+        }
+        series["a"][:5] = np.nan  # warmup
+        series["c"][50] = np.nan
+
+        conds = parse_conditions(raw)
+        signal = compute_signal(conds, series.get, n)
+
+        def at(i):
+            if i < 0:
+                return {}
+            return {
+                k: (None if np.isnan(v[i]) else float(v[i]))
+                for k, v in series.items() if k != "bar.close"
+            }
+
+        for i in range(n):
+            bar = _bar(close=float(series["bar.close"][i]))
+            assert bool(signal[i]) == evaluate_all(conds, bar, at(i), at(i - 1))
+
+    def test_unresolved_operand(self):
+        import numpy as np
+        from replaybt.strategy.declarative import compute_signal
+
+        conds = parse_conditions([{"type": "above", "left": "a", "right": "z"}])
+        assert compute_signal(conds, {"a": np.zeros(3)}.get, 3) is None
+
+    def test_batch_run_matches_scalar(self, tmp_path):
+        """CSV-backed run uses signal arrays and reproduces the scalar trades."""
+        import math
+        from replaybt.data.providers.csv import CSVProvider
+
+        base = datetime(2025, 1, 1)
+        bars = []
+        for i in range(400):
+            p = 100 + 10 * math.sin(i / 12) + (i % 7) * 0.3
+            bars.append(Bar(base + timedelta(minutes=i), p, p + 1, p - 1, p, 1000.0, "TEST", "1m"))
+        path = tmp_path / "TEST_1m.csv"
+        with open(path, "w") as f:
+            f.write("timestamp,open,high,low,close,volume\n")
+            for b in bars:
+                f.write(f"{b.timestamp},{b.open!r},{b.high!r},{b.low!r},{b.close!r},{b.volume!r}\n")
+
+        class _ListProvider(DataProvider):
+            def __iter__(self):
+                return iter(bars)
+
+            def symbol(self):
+                return "TEST"
+
+            def timeframe(self):
+                return "1m"
+
+        config = _make_config(
+            indicators={
+                "ema_fast": {"type": "ema", "period": 3},
+                "ema_slow": {"type": "ema", "period": 8},
+                "rsi": {"type": "rsi", "period": 7},
+            },
+            exit={"take_profit_pct": 0.02, "stop_loss_pct": 0.01},
+        )
+        config["entry"]["long"]["conditions"].append(
+            {"type": "below_threshold", "indicator": "rsi", "value": 70.0},
+        )
+        config["entry"]["short"]["conditions"].append(
+            {"type": "above", "left": "ema_slow", "right": "bar.close"},
+        )
+
+        def run(provider):
+            strat = DeclarativeStrategy(config)
+            engine = BacktestEngine(
+                strategy=strat, data=provider,
+                config={"indicators": strat.indicator_config()},
+            )
+            return strat, engine.run()
+
+        batch_strat, batch = run(CSVProvider(path, "TEST"))
+        scalar_strat, scalar = run(_ListProvider())
+
+        assert batch_strat._long_signal is not None
+        assert scalar_strat._long_signal is None
+        assert batch.total_trades > 0
+        assert [(t.entry_time, t.side, t.reason) for t in batch.trades] == [
+            (t.entry_time, t.side, t.reason) for t in scalar.trades
+        ]
@@ -0,0 +1,51 @@
+"""Tests for vectorized signal helpers."""
+
+import numpy as np
+
+from replaybt.strategy.signals import crossover, crossunder, events
+
+
+def _scalar_cross(a, b, up=True):
+    out = [False]
+    for i in range(1, len(a)):
+        if up:
+            out.append(a[i] > b[i] and a[i - 1] <= b[i - 1])
+        else:
+            out.append(a[i] < b[i] and a[i - 1] >= b[i - 1])
+    return out
+
+
+class TestCrossover:
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=300)
+        b = rng.normal(size=300)
+        assert crossover(a, b).tolist() == _scalar_cross(a, b, up=True)
+        assert crossunder(a, b).tolist() == _scalar_cross(a, b, up=False)
+
+    def test_first_bar_never_crosses(self):
+        assert crossover([2.0], [1.0]).tolist() == [False]
+        assert crossover([], []).tolist() == []
+
+    def test_touch_then_cross(self):
+        a = np.array([1.0, 2.0, 3.0])
+        b = np.array([2.0, 2.0, 2.0])
+        # equal at bar 1 counts as "not above" for the previous bar
+        assert crossover(a, b).tolist() == [False, False, True]
+
+    def test_scalar_threshold(self):
+        rsi = np.array([25.0, 35.0, 28.0, 31.0])
+        assert crossover(rsi, 30.0).tolist() == [False, True, False, True]
+        assert crossunder(rsi, 30.0).tolist() == [False, False, True, False]
+
+    def test_nan_never_signals(self):
+        a = np.array([np.nan, 3.0, 1.0, 3.0])
+        b = np.array([2.0, 2.0, np.nan, 2.0])
+        assert not crossover(a, b).any()
+        assert not crossunder(a, b).any()
+
+
+class TestEvents:
+    def test_indices(self):
+        mask = np.array([False, True, False, True])
+        assert events(mask).tolist() == [1, 3]
@@ -226,3 +226,46 @@ class TestOOSSplit:
             config={"initial_equity": 10000},
         ).run()
         assert result.wr_divergence == 0.0
+
+
+def _write_csv(path, bars):
+    with open(path, "w") as f:
+        f.write("timestamp,open,high,low,close,volume\n")
+        for b in bars:
+            f.write(f"{b.timestamp},{b.open!r},{b.high!r},{b.low!r},{b.close!r},{b.volume!r}\n")
+
+
+class TestColumnarProviders:
+    """CSV-backed runs reuse the provider's buffers and match list-backed runs."""
+
+    def test_delay_test_matches_list_provider(self, tmp_path):
+        from replaybt.data.providers.csv import CSVProvider
+
+        bars = make_timing_sensitive_bars()
+        path = tmp_path / "TEST_1m.csv"
+        _write_csv(path, bars)
+
+        kwargs = dict(strategy_factory=TimingSensitiveStrategy, config={"initial_equity": 10000})
+        from_list = DelayTest(data=ListProvider(bars), **kwargs).run()
+        from_csv = DelayTest(data=CSVProvider(path, "TEST"), **kwargs).run()
+        assert from_csv.normal.net_pnl == from_list.normal.net_pnl
+        assert from_csv.delayed.net_pnl == from_list.delayed.net_pnl
+
+    def test_oos_split_matches_list_provider(self, tmp_path):
+        from replaybt.data.providers.csv import CSVProvider
+
+        bars = make_trending_bars(100)
+        path = tmp_path / "TEST_1m.csv"
+        _write_csv(path, bars)
+
+        kwargs = dict(
+            strategy_factory=RobustTrendStrategy,
+            config={"initial_equity": 10000},
+            split_ratio=0.7,
+        )
+        from_list = OOSSplit(data=ListProvider(bars), **kwargs).run()
+        from_csv = OOSSplit(data=CSVProvider(path, "TEST"), **kwargs).run()
+        assert from_csv.train.net_pnl == from_list.train.net_pnl
+        assert from_csv.test.net_pnl == from_list.test.net_pnl
+        assert from_csv.pnl_ratio == from_list.pnl_ratio
+        assert from_csv.verdict == from_list.verdict